@@ -15,7 +15,7 @@
 """Base class for metric builders."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 from nvidia_tao_core.telemetry.types import TelemetryData
 
@@ -38,6 +38,9 @@ class MetricBuilder(ABC):
                 metrics['custom_metric'] = compute_value(telemetry_data)
     """
 
+    # Subclasses without their own __slots__ still get a per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def build(
         self,
@@ -53,3 +56,22 @@ class MetricBuilder(ABC):
             context: Additional context (e.g., timestamps, configuration)
         """
         pass
+
+    def build_many(
+        self,
+        metrics: Dict[str, Any],
+        events: Iterable[TelemetryData],
+        context: Dict[str, Any]
+    ) -> None:
+        """Build and update metrics for several events sharing one context.
+
+        The default implementation calls build() for each event. Builders that
+        can aggregate a batch more cheaply may override it.
+
+        Args:
+            metrics: Metrics dictionary to update (modified in place)
+            events: Normalized telemetry data for each event
+            context: Additional context (e.g., timestamps, configuration)
+        """
+        for telemetry_data in events:
+            self.build(metrics, telemetry_data, context)
@@ -14,13 +14,25 @@
 
 """Comprehensive metrics builder with all attributes."""
 
-from typing import Any, Dict, List
+from collections import Counter
+from typing import Any, Dict, Iterable, List
 
 from nvidia_tao_core.telemetry.builders.base import MetricBuilder
 from nvidia_tao_core.telemetry.config import METRIC_ATTRIBUTES
 from nvidia_tao_core.telemetry.types import AttributeType, TelemetryData
 from nvidia_tao_core.telemetry.utils import create_gpu_identifier
 
+# Status should come after version (order=3)
+_STATUS_ORDER = 4
+
+# (name, metric_order, is boolean) for attributes in the comprehensive metric name,
+# sorted by metric_order once at import instead of on every event
+_COMPREHENSIVE_ATTRIBUTES = tuple(
+    (attr.name, attr.metric_order, attr.attr_type == AttributeType.BOOLEAN)
+    for attr in sorted(METRIC_ATTRIBUTES, key=lambda a: a.metric_order)
+    if attr.include_in_comprehensive
+)
+
 
 class ComprehensiveMetricsBuilder(MetricBuilder):
     """Builder for comprehensive metrics with all attributes.
@@ -35,6 +47,8 @@ class ComprehensiveMetricsBuilder(MetricBuilder):
     without needing separate metric counters for each combination.
     """
 
+    __slots__ = ()
+
     def build(
         self,
         metrics: Dict[str, Any],
@@ -51,6 +65,26 @@ class ComprehensiveMetricsBuilder(MetricBuilder):
         metric_name = self._build_metric_name(telemetry_data)
         metrics[metric_name] = metrics.get(metric_name, 0) + 1
 
+    def build_many(
+        self,
+        metrics: Dict[str, Any],
+        events: Iterable[TelemetryData],
+        context: Dict[str, Any]
+    ) -> None:
+        """Build comprehensive metrics for several events.
+
+        Events are counted per metric name first, then merged into metrics once
+        per name.
+
+        Args:
+            metrics: Metrics dictionary to update
+            events: Normalized telemetry data for each event
+            context: Additional context (unused by this builder)
+        """
+        counts = Counter(self._build_metric_name(telemetry_data) for telemetry_data in events)
+        for metric_name, count in counts.items():
+            metrics[metric_name] = metrics.get(metric_name, 0) + count
+
     def _build_metric_name(self, telemetry_data: TelemetryData) -> str:
         """Build comprehensive metric name using configured attributes.
 
@@ -75,32 +109,25 @@ class ComprehensiveMetricsBuilder(MetricBuilder):
         # Add GPU identifier (special handling)
         gpu_identifier = create_gpu_identifier(telemetry_data.get('gpus', ['unknown']))
 
-        # Collect attributes that should be included in comprehensive metric
-        # Sort by metric_order to maintain consistent ordering
-        attrs_to_include = [
-            (attr, telemetry_data.get(attr.name))
-            for attr in sorted(METRIC_ATTRIBUTES, key=lambda a: a.metric_order)
-            if attr.include_in_comprehensive and attr.name in telemetry_data
-        ]
-
-        # Build components in order, inserting status at the right position
-        # Status should come after version (order=3)
-        STATUS_ORDER = 4
-
-        for attr, value in attrs_to_include:
-            # Insert status before elements with order >= STATUS_ORDER
-            if attr.metric_order >= STATUS_ORDER and not any(
-                comp == "status" for comp in components
-            ):
+        # Build components in metric_order, inserting status at the right position
+        status_added = False
+        for name, metric_order, is_boolean in _COMPREHENSIVE_ATTRIBUTES:
+            if name not in telemetry_data:
+                continue
+            value = telemetry_data[name]
+
+            # Insert status before elements with order >= _STATUS_ORDER
+            if metric_order >= _STATUS_ORDER and not status_added:
                 components.extend(["status", status])
+                status_added = True
 
-            if attr.attr_type == AttributeType.BOOLEAN:
-                components.extend([attr.name, str(value).lower()])
+            if is_boolean:
+                components.extend([name, str(value).lower()])
             else:
-                components.extend([attr.name, str(value)])
+                components.extend([name, str(value)])
 
-        # If status wasn't inserted (no attributes with order >= STATUS_ORDER), add it now
-        if "status" not in components:
+        # If status wasn't inserted (no attributes with order >= _STATUS_ORDER), add it now
+        if not status_added:
             components.extend(["status", status])
 
         # Add GPU identifier at the end
@@ -53,12 +53,235 @@ Example metrics:
     tao_job_gpu_total{tao_gpu_type="A100"} = 2
 """
 
-from typing import Any, Dict
+import functools
+import sys
+from collections import Counter
+from typing import Any, Dict, Iterable, List
 
 from nvidia_tao_core.telemetry.builders.base import MetricBuilder
 from nvidia_tao_core.telemetry.config import METRIC_ATTRIBUTES
 from nvidia_tao_core.telemetry.types import AttributeType, TelemetryData
 
+# The GPU classification helpers below are plain functions of str/Counter inputs with
+# no builder state, so they are memoizable and can be compiled independently.
+
+# GPU model lookup tables used by _extract_gpu_type, built once at import.
+# Model tuples are checked by substring match in order, so longer names come first.
+_GRACE_MODELS = ('GB300', 'GB200', 'GB100', 'GH200', 'GH100')
+_BLACKWELL_HOPPER_MODELS = ('B300', 'B200', 'B100', 'H200', 'H100')
+_L_SERIES_MODELS = ('L40S', 'L40', 'L4')
+_GPU_NAME_PREFIXES = frozenset({'NVIDIA', 'GEFORCE', 'QUADRO', 'TESLA', 'JETSON', 'TITAN'})
+_GPU_VENDOR_PREFIXES = frozenset({'NVIDIA', 'GEFORCE', 'QUADRO', 'TESLA'})
+
+# Attributes that are metric values or derived labels rather than labels themselves
+_NON_LABEL_ATTRIBUTES = ('success', 'time_lapsed')
+
+# (attribute name, label key, is boolean) for each configured attribute used directly
+# as a label. Lists (e.g. GPUs) are handled separately.
+_LABEL_ATTRIBUTES = tuple(
+    (attr.name, f'tao_{attr.name}', attr.attr_type == AttributeType.BOOLEAN)
+    for attr in METRIC_ATTRIBUTES
+    if attr.name not in _NON_LABEL_ATTRIBUTES and attr.attr_type != AttributeType.LIST
+)
+
+# GPU priority order (newest to oldest) based on compute capability
+# Reference: https://developer.nvidia.com/cuda-gpus
+# Used to select primary GPU in mixed-GPU jobs
+_GPU_PRIORITY = (
+    # Compute Capability 12.0 - Blackwell Consumer/Pro
+    'RTX5090', 'RTX5080', 'RTX5070', 'RTX5060', 'RTX5050',
+    'RTX6000', 'RTX5000', 'RTX4500', 'RTX4000', 'RTX2000',  # RTX PRO Blackwell
+
+    # Compute Capability 11.0 - Jetson Thor
+    'T5000', 'T4000',
+
+    # Compute Capability 10.3 - Grace Blackwell Ultra
+    'GB300', 'B300',
+
+    # Compute Capability 10.0 - Grace Blackwell
+    'GB200', 'B200',
+
+    # Compute Capability 9.0 - Grace Hopper / Hopper
+    'GH200', 'H200', 'H100',
+
+    # Compute Capability 8.9 - Ada Lovelace (Data Center & Consumer)
+    'L40S', 'L40', 'L4',
+    'RTX4090', 'RTX4080', 'RTX4070', 'RTX4060', 'RTX4050',  # GeForce RTX 40 series
+    'RTXA6000', 'RTXA5000', 'RTXA4500', 'RTXA4000', 'RTXA2000',  # RTX Ada Pro
+
+    # Compute Capability 8.7 - Jetson Orin
+    'ORIN',
+
+    # Compute Capability 8.6 - Ampere (Consumer/Workstation)
+    'A40', 'A16', 'A10', 'A2',
+    'RTX3090', 'RTX3080', 'RTX3070', 'RTX3060', 'RTX3050',  # GeForce RTX 30 series
+
+    # Compute Capability 8.0 - Ampere (Data Center)
+    'A100', 'A30',
+
+    # Compute Capability 7.5 - Turing
+    'T4', 'T2000', 'T1200', 'T1000', 'T600', 'T500', 'T400',
+    'RTX2080', 'RTX2070', 'RTX2060',  # GeForce RTX 20 series
+    'QUADRO8000', 'QUADRO6000', 'QUADRO5000', 'QUADRO4000',  # Quadro RTX
+
+    # Compute Capability 7.0 - Volta
+    'V100', 'TITAN',
+
+    # Compute Capability 6.x - Pascal
+    'P100', 'P40', 'P6', 'P4',
+    'GTX1080', 'GTX1070', 'GTX1060', 'GTX1050',
+
+    # Older (in case encountered)
+    'K80', 'K40', 'K20', 'M60', 'M40',
+)
+# Rank of each GPU type in _GPU_PRIORITY (lower = newer) for O(1) priority lookups
+_GPU_PRIORITY_RANK = {gpu: rank for rank, gpu in enumerate(_GPU_PRIORITY)}
+
+# High-cardinality labels moved from tao_job_total to tao_job_network_total when
+# the job counter is split (legacy=False)
+_NETWORK_LABEL_ORDER = ('tao_gpu_count', 'tao_network', 'tao_primary_gpu')
+
+# Pre-rendered label values for booleans, job status and (bounded) GPU counts
+_BOOL_STR = {True: 'true', False: 'false'}
+_STATUS_STR = {True: 'pass', False: 'fail'}
+_SMALL_COUNT = {i: str(i) for i in range(65)}
+
+# Sentinel for attributes missing from the telemetry data
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_gpu_type(gpu_name: str) -> str:
+    """Extract GPU type from GPU name.
+
+    Extracts the model identifier from full GPU name, handling various formats
+    including datacenter GPUs, consumer GPUs, RTX series, and Jetson devices.
+    Results are memoized since the same few GPU names repeat across jobs.
+
+    Args:
+        gpu_name: Full GPU name (e.g., 'NVIDIA A100 40GB', 'GeForce RTX 4090', 'Jetson Orin')
+
+    Returns:
+        Simplified GPU type (e.g., 'A100', 'RTX4090', 'GH200', 'ORIN')
+
+    Examples:
+        >>> _extract_gpu_type('NVIDIA A100 40GB')
+        'A100'
+        >>> _extract_gpu_type('GeForce RTX 4090')
+        'RTX4090'
+        >>> _extract_gpu_type('NVIDIA GH200')
+        'GH200'
+        >>> _extract_gpu_type('NVIDIA RTX A6000')
+        'RTXA6000'
+        >>> _extract_gpu_type('Jetson AGX Orin')
+        'ORIN'
+        >>> _extract_gpu_type('NVIDIA L40S')
+        'L40S'
+    """
+    # Normalize: uppercase, replace spaces and dashes with underscores
+    gpu_upper = str(gpu_name).upper().replace(' ', '_').replace('-', '_')
+    # Tokenize once; the RTX, Jetson and standard-model checks below all walk these parts
+    parts = gpu_upper.split('_')
+
+    # Special handling for specific GPU families
+    if 'SPARK' in gpu_upper:
+        return 'SPARK'
+    # Grace Blackwell / Grace Hopper (GB/GH prefix)
+    for model in _GRACE_MODELS:
+        if model in gpu_upper:
+            return model
+
+    # Blackwell / Hopper (B200, B300, H200, H100)
+    for model in _BLACKWELL_HOPPER_MODELS:
+        if model in gpu_upper:
+            return model
+
+    # RTX series (consumer and pro)
+    # RTX 5090, RTX 4090, RTX A6000, etc.
+    if 'RTX' in gpu_upper:
+        # Extract RTX model
+        for i, part in enumerate(parts):
+            if part == 'RTX' and i + 1 < len(parts):
+                # Next part is the model (e.g., '5090', 'A6000', '4090')
+                model = parts[i + 1]
+                # Remove 'TI' suffix if present
+                model = model.replace('TI', '')
+                # Remove 'ADA' suffix if present (e.g., "RTX 6000 Ada")
+                model = model.replace('ADA', '')
+                return f'RTX{model}'
+
+    # Jetson and embedded series (Orin, Xavier, Nano, Thor, etc.)
+    if 'JETSON' in gpu_upper or 'THOR' in gpu_upper or 'ORIN' in gpu_upper:
+        # Jetson T5000, T4000 (e.g., Jetson Thor models)
+        for part in parts:
+            if part.startswith('T') and any(c.isdigit() for c in part):
+                return part
+        if 'THOR' in gpu_upper:
+            return 'THOR'
+        if 'ORIN' in gpu_upper:
+            return 'ORIN'
+
+    # L-series (L40S, L40, L4)
+    for model in _L_SERIES_MODELS:
+        if model in gpu_upper:
+            return model
+
+    # Standard datacenter/consumer GPUs (A100, V100, T4, P100, etc.)
+    # Find part with both letters and numbers
+    for part in parts:
+        # Skip common prefixes
+        if part in _GPU_NAME_PREFIXES:
+            continue
+
+        # Look for model identifier (has both letters and numbers)
+        if any(c.isdigit() for c in part) and any(c.isalpha() for c in part):
+            # Found model like A100, V100, T4, P100, K80, etc.
+            return part
+
+    # If still no match, return first non-common part
+    for part in parts:
+        if part and part not in _GPU_VENDOR_PREFIXES:
+            return part
+
+    # Fallback to sanitized original name
+    return gpu_upper.replace('NVIDIA_', '').replace('GEFORCE_', '')
+
+
+def _select_primary_gpu(gpu_type_counts: Counter, priority_rank: Dict[str, int] = _GPU_PRIORITY_RANK) -> str:
+    """Select the primary GPU type from already-counted GPU types.
+
+    Args:
+        gpu_type_counts: Counter mapping GPU type to count (must be non-empty)
+        priority_rank: Rank of each known GPU type (lower = newer)
+
+    Returns:
+        Newest GPU type by priority, or the most common type if none is known
+    """
+    # Select the newest known type with a single pass over the distinct types
+    known_types = [gpu_type for gpu_type in gpu_type_counts if gpu_type in priority_rank]
+    if known_types:
+        return min(known_types, key=priority_rank.__getitem__)
+
+    # If no match in priority list, use most common
+    # (Fallback for unknown GPU types; ties broken by name)
+    return max(gpu_type_counts.items(), key=lambda x: (x[1], x[0]))[0]
+
+
+@functools.lru_cache(maxsize=64)
+def _label_template(label_keys: tuple) -> str:
+    """Build a str.format_map template for a label set.
+
+    Label sets are few and fixed (job labels, network labels, GPU type), so each
+    template is built once and reused for every key with the same labels.
+
+    Args:
+        label_keys: Label keys in any order
+
+    Returns:
+        Template like 'a="{a}",b="{b}"' with keys sorted alphabetically
+    """
+    return ','.join(f'{k}="{{{k}}}"' for k in sorted(label_keys))
+
 
 class LabeledMetricsBuilder(MetricBuilder):
     """Builder for labeled metrics using Prometheus-style labels.
@@ -71,171 +294,295 @@ class LabeledMetricsBuilder(MetricBuilder):
     - tao_job_duration_sum: Sum of job durations (use with tao_job_total to calculate average)
     - tao_job_gpu_time_sum: Sum of GPU-seconds (gpu_count × duration, for GPU-hour calculations)
     - tao_job_gpu_total: Total GPU usage by GPU type (tracks all GPUs including mixed jobs)
+
+    With legacy=False the network, primary_gpu and gpu_count labels are moved out of
+    tao_job_total (and the duration/GPU-time sums) into a separate
+    tao_job_network_total counter, so the number of series grows additively across
+    the two label sets instead of multiplicatively.
     """
 
-    def __init__(self):
-        """Initialize the labeled metrics builder."""
+    __slots__ = ('legacy', 'bucket_gpu_count', 'metric_names', '_gpu_priority', '_gpu_priority_rank')
+
+    def __init__(self, legacy: bool = True, bucket_gpu_count: bool = False):
+        """Initialize the labeled metrics builder.
+
+        Args:
+            legacy: Keep all labels on tao_job_total. Set to False to split the
+                network/GPU labels into tao_job_network_total.
+            bucket_gpu_count: Report tao_gpu_count as a range ("1", "2-4", "5-8",
+                "9-16", ">16") instead of the exact count. GPU-time values still
+                use the exact count.
+        """
+        self.legacy = legacy
+        self.bucket_gpu_count = bucket_gpu_count
+
         # Base metric names following Prometheus naming conventions
         self.metric_names = {
             'counter': 'tao_job_total',
+            'network_counter': 'tao_job_network_total',
             'duration_sum': 'tao_job_duration_sum',
             'gpu_time_sum': 'tao_job_gpu_time_sum',
             'gpu_total': 'tao_job_gpu_total'
         }
 
-        # GPU priority order (newest to oldest) based on compute capability
-        # Reference: https://developer.nvidia.com/cuda-gpus
-        # Used to select primary GPU in mixed-GPU jobs
-        self.gpu_priority = [
-            # Compute Capability 12.0 - Blackwell Consumer/Pro
-            'RTX5090', 'RTX5080', 'RTX5070', 'RTX5060', 'RTX5050',
-            'RTX6000', 'RTX5000', 'RTX4500', 'RTX4000', 'RTX2000',  # RTX PRO Blackwell
+        # GPU priority order (newest to oldest), shared across instances unless overridden
+        self.gpu_priority = _GPU_PRIORITY
+
+    @property
+    def gpu_priority(self) -> tuple:
+        """GPU types from newest to oldest, used to select the primary GPU."""
+        return self._gpu_priority
+
+    @gpu_priority.setter
+    def gpu_priority(self, priority: Iterable[str]) -> None:
+        """Set the GPU priority order and rebuild its rank lookup."""
+        if priority is _GPU_PRIORITY:
+            self._gpu_priority = _GPU_PRIORITY
+            self._gpu_priority_rank = _GPU_PRIORITY_RANK
+            return
+        self._gpu_priority = tuple(priority)
+        # Keep the first position of a type listed more than once
+        self._gpu_priority_rank = {}
+        for rank, gpu in enumerate(self._gpu_priority):
+            self._gpu_priority_rank.setdefault(gpu, rank)
 
-            # Compute Capability 11.0 - Jetson Thor
-            'T5000', 'T4000',
+    def build(
+        self,
+        metrics: Dict[str, Any],
+        telemetry_data: TelemetryData,
+        context: Dict[str, Any]
+    ) -> None:
+        """Build labeled metrics from telemetry data.
 
-            # Compute Capability 10.3 - Grace Blackwell Ultra
-            'GB300', 'B300',
+        Args:
+            metrics: Metrics dictionary to update
+            telemetry_data: Normalized telemetry data
+            context: Additional context
+        """
+        gpus, gpu_type_counts, labels, network_labels = self._event_labels(telemetry_data)
+        time_lapsed = telemetry_data.get('time_lapsed', 0)
+
+        if network_labels is not None:
+            network_key = self._build_metric_key(self.metric_names['network_counter'], network_labels)
+            metrics[network_key] = metrics.get(network_key, 0) + 1
 
-            # Compute Capability 10.0 - Grace Blackwell
-            'GB200', 'B200',
+        # Zero-duration events (e.g. early failures) do not contribute to the sums
+        duration = time_lapsed if time_lapsed > 0 else 0
+        self._add_job_metrics(metrics, self._build_label_str(labels), 1, duration, len(gpus) * duration)
+        self._add_gpu_totals(metrics, gpu_type_counts)
+
+    def build_many(
+        self,
+        metrics: Dict[str, Any],
+        events: Iterable[TelemetryData],
+        context: Dict[str, Any]
+    ) -> None:
+        """Build labeled metrics for several events (see build_batch).
 
-            # Compute Capability 9.0 - Grace Hopper / Hopper
-            'GH200', 'H200', 'H100',
+        Args:
+            metrics: Metrics dictionary to update
+            events: Normalized telemetry data for each event
+            context: Additional context
+        """
+        self.build_batch(metrics, events, context)
 
-            # Compute Capability 8.9 - Ada Lovelace (Data Center & Consumer)
-            'L40S', 'L40', 'L4',
-            'RTX4090', 'RTX4080', 'RTX4070', 'RTX4060', 'RTX4050',  # GeForce RTX 40 series
-            'RTXA6000', 'RTXA5000', 'RTXA4500', 'RTXA4000', 'RTXA2000',  # RTX Ada Pro
+    def build_batch(
+        self,
+        metrics: Dict[str, Any],
+        events: Iterable[TelemetryData],
+        context: Dict[str, Any]
+    ) -> None:
+        """Build labeled metrics from several telemetry events at once.
 
-            # Compute Capability 8.7 - Jetson Orin
-            'ORIN',
+        Events are first aggregated per label set, then merged into metrics in a
+        single pass, so each metric key is updated once per batch rather than once
+        per event.
 
-            # Compute Capability 8.6 - Ampere (Consumer/Workstation)
-            'A40', 'A16', 'A10', 'A2',
-            'RTX3090', 'RTX3080', 'RTX3070', 'RTX3060', 'RTX3050',  # GeForce RTX 30 series
+        Args:
+            metrics: Metrics dictionary to update
+            events: Normalized telemetry data for each event
+            context: Additional context
+        """
+        # Per job label set (as label items): [job count, duration sum, GPU-time sum].
+        # Keys are formatted only once per distinct label set, when merging.
+        job_totals: Dict[tuple, List[int]] = {}
+        network_totals: Counter = Counter()
+        gpu_type_totals: Counter = Counter()
 
-            # Compute Capability 8.0 - Ampere (Data Center)
-            'A100', 'A30',
+        # The network counter name is fixed for the whole batch; look it up once
+        network_counter_name = self.metric_names['network_counter']
 
-            # Compute Capability 7.5 - Turing
-            'T4', 'T2000', 'T1200', 'T1000', 'T600', 'T500', 'T400',
-            'RTX2080', 'RTX2070', 'RTX2060',  # GeForce RTX 20 series
-            'QUADRO8000', 'QUADRO6000', 'QUADRO5000', 'QUADRO4000',  # Quadro RTX
+        for telemetry_data in events:
+            gpus, gpu_type_counts, labels, network_labels = self._event_labels(telemetry_data)
+            time_lapsed = telemetry_data.get('time_lapsed', 0)
+            gpu_type_totals.update(gpu_type_counts)
 
-            # Compute Capability 7.0 - Volta
-            'V100', 'TITAN',
+            if network_labels is not None:
+                network_totals[self._build_metric_key(network_counter_name, network_labels)] += 1
 
-            # Compute Capability 6.x - Pascal
-            'P100', 'P40', 'P6', 'P4',
-            'GTX1080', 'GTX1070', 'GTX1060', 'GTX1050',
+            label_items = tuple(labels.items())
+            totals = job_totals.get(label_items)
+            if totals is None:
+                totals = job_totals[label_items] = [0, 0, 0]
+            totals[0] += 1
+            # Zero-duration events (e.g. early failures) do not contribute to the sums
+            if time_lapsed > 0:
+                totals[1] += time_lapsed
+                totals[2] += len(gpus) * time_lapsed  # GPU-seconds
 
-            # Older (in case encountered)
-            'K80', 'K40', 'K20', 'M60', 'M40',
-        ]
+        for network_key, count in network_totals.items():
+            metrics[network_key] = metrics.get(network_key, 0) + count
 
-    def build(
-        self,
-        metrics: Dict[str, Any],
-        telemetry_data: TelemetryData,
-        context: Dict[str, Any]
-    ) -> None:
-        """Build labeled metrics from telemetry data.
+        for label_items, (job_count, duration, gpu_time) in job_totals.items():
+            self._add_job_metrics(metrics, self._build_label_str(dict(label_items)), job_count, duration, gpu_time)
+
+        self._add_gpu_totals(metrics, gpu_type_totals)
+
+    def _event_labels(self, telemetry_data: TelemetryData) -> tuple:
+        """Classify an event's GPUs and build its job (and network) labels.
 
         Args:
-            metrics: Metrics dictionary to update
             telemetry_data: Normalized telemetry data
-            context: Additional context
+
+        Returns:
+            Tuple of (GPU names, Counter of GPU types, job labels, network labels).
+            Network labels are None unless the job counter is split (legacy=False).
         """
-        # Extract GPU information
         gpus = telemetry_data.get('gpus', [])
-        gpu_count = len(gpus)
-        time_lapsed = telemetry_data.get('time_lapsed', 0)
+
+        # Classify each GPU once; shared by the labels and the per-type GPU totals
+        gpu_type_counts = self._count_gpu_types(gpus)
 
         # Extract labels from telemetry data (includes primary_gpu and gpu_count)
-        labels = self._build_labels(telemetry_data, gpus)
+        labels = self._build_labels(telemetry_data, gpus, gpu_type_counts)
+
+        network_labels = None
+        if not self.legacy:
+            # Count network/GPU dimensions on their own metric
+            network_labels = {k: labels.pop(k) for k in _NETWORK_LABEL_ORDER if k in labels}
+
+        return gpus, gpu_type_counts, labels, network_labels
+
+    def _add_job_metrics(
+        self,
+        metrics: Dict[str, Any],
+        label_str: str,
+        job_count: int,
+        duration: int,
+        gpu_time: int
+    ) -> None:
+        """Add job count, duration and GPU-time totals for one rendered label set.
 
+        Args:
+            metrics: Metrics dictionary to update
+            label_str: Rendered job labels (see _build_label_str)
+            job_count: Number of jobs with these labels
+            duration: Summed duration of those jobs
+            gpu_time: Summed GPU-seconds of those jobs
+        """
         # 1. Job counter - main metric
-        counter_key = self._build_metric_key(self.metric_names['counter'], labels)
-        metrics[counter_key] = metrics.get(counter_key, 0) + 1
+        counter_key = sys.intern(f"{self.metric_names['counter']}{{{label_str}}}")
+        metrics[counter_key] = metrics.get(counter_key, 0) + job_count
 
         # 2. Duration sum (accumulates across all jobs with same labels)
-        if time_lapsed > 0:
+        # Only emitted once some job with these labels reported a duration
+        if duration > 0:
             # Use same labels as job counter for easy division (average = sum / count)
-            duration_sum_key = self._build_metric_key(
-                self.metric_names['duration_sum'],
-                labels
-            )
+            duration_sum_key = sys.intern(f"{self.metric_names['duration_sum']}{{{label_str}}}")
             # Accumulate duration (counter behavior)
-            metrics[duration_sum_key] = metrics.get(duration_sum_key, 0) + time_lapsed
+            metrics[duration_sum_key] = metrics.get(duration_sum_key, 0) + duration
 
             # 3. GPU-time sum (gpu_count × duration, pre-calculated for GPU-hour calculations)
-            gpu_time = gpu_count * time_lapsed  # GPU-seconds
-            gpu_time_sum_key = self._build_metric_key(
-                self.metric_names['gpu_time_sum'],
-                labels
-            )
+            gpu_time_sum_key = sys.intern(f"{self.metric_names['gpu_time_sum']}{{{label_str}}}")
             metrics[gpu_time_sum_key] = metrics.get(gpu_time_sum_key, 0) + gpu_time
 
-        # 4. GPU total counter (per GPU type, tracks all GPUs including mixed jobs)
-        gpu_type_counts = self._count_gpu_types(gpus)
+    def _add_gpu_totals(self, metrics: Dict[str, Any], gpu_type_counts: Counter) -> None:
+        """Add per-GPU-type totals (tracks all GPUs including mixed jobs).
+
+        Args:
+            metrics: Metrics dictionary to update
+            gpu_type_counts: Counter mapping GPU type to count
+        """
+        # 4. GPU total counter (per GPU type)
+        gpu_total_name = self.metric_names['gpu_total']
         for gpu_type, count in gpu_type_counts.items():
-            gpu_total_key = self._build_metric_key(
-                self.metric_names['gpu_total'],
-                {'tao_gpu_type': gpu_type}
-            )
+            gpu_total_key = self._build_metric_key(gpu_total_name, {'tao_gpu_type': gpu_type})
             metrics[gpu_total_key] = metrics.get(gpu_total_key, 0) + count
 
-    def _build_labels(self, telemetry_data: TelemetryData, gpus: list) -> Dict[str, str]:
+    def _build_labels(
+        self,
+        telemetry_data: TelemetryData,
+        gpus: list,
+        gpu_type_counts: Counter
+    ) -> Dict[str, str]:
         """Build label dictionary from telemetry data.
 
         Args:
             telemetry_data: Normalized telemetry data
             gpus: List of GPU names (passed separately for efficiency)
+            gpu_type_counts: Counter of GPU types in gpus
 
         Returns:
             Dictionary of label key-value pairs
         """
         labels: Dict[str, str] = {}
 
-        # Add standard labels from configured attributes
-        for attr in METRIC_ATTRIBUTES:
-            if attr.name not in telemetry_data:
-                continue
-
-            # Skip fields that are handled separately or are metric values, not labels
-            if attr.name in ('success', 'time_lapsed'):
+        # Add standard labels from configured attributes (one lookup per attribute)
+        for name, label_key, is_boolean in _LABEL_ATTRIBUTES:
+            value = telemetry_data.get(name, _MISSING)
+            if value is _MISSING:
                 continue
 
             # Convert attribute to label
-            value = telemetry_data[attr.name]
-
-            if attr.attr_type == AttributeType.BOOLEAN:
-                labels[f'tao_{attr.name}'] = str(value).lower()
-            elif attr.attr_type == AttributeType.LIST:
-                # Lists handled separately (e.g., GPUs)
-                continue
+            if is_boolean:
+                labels[label_key] = _BOOL_STR[value] if value is True or value is False else str(value).lower()
             else:
-                labels[f'tao_{attr.name}'] = str(value)
+                # Configured attributes have bounded values; intern so repeated
+                # values share one string object
+                labels[label_key] = sys.intern(str(value))
 
         # Add derived status label (from success field)
         success = telemetry_data.get('success', False)
-        labels['tao_status'] = 'pass' if success else 'fail'
+        labels['tao_status'] = _STATUS_STR[bool(success)]
 
         # Add GPU labels
         if gpus:
             # Primary GPU (most recent/modern, or most common if same generation)
-            primary_gpu = self._extract_primary_gpu(gpus)
+            primary_gpu = self._select_primary_gpu(gpu_type_counts)
             labels['tao_primary_gpu'] = primary_gpu
 
             # GPU count
-            labels['tao_gpu_count'] = str(len(gpus))
+            gpu_count = len(gpus)
+            if self.bucket_gpu_count:
+                labels['tao_gpu_count'] = self._bucket_gpu_count(gpu_count)
+            else:
+                labels['tao_gpu_count'] = _SMALL_COUNT.get(gpu_count) or str(gpu_count)
         else:
             labels['tao_primary_gpu'] = 'unknown'
             labels['tao_gpu_count'] = '0'
 
         return labels
 
+    @staticmethod
+    def _bucket_gpu_count(gpu_count: int) -> str:
+        """Map a GPU count to its label bucket.
+
+        Args:
+            gpu_count: Number of GPUs in the job (at least 1)
+
+        Returns:
+            One of "1", "2-4", "5-8", "9-16" or ">16"
+        """
+        if gpu_count <= 1:
+            return '1'
+        if gpu_count <= 4:
+            return '2-4'
+        if gpu_count <= 8:
+            return '5-8'
+        if gpu_count <= 16:
+            return '9-16'
+        return '>16'
+
     def _extract_primary_gpu(self, gpus: list) -> str:
         """Extract primary GPU from list, prioritizing newer GPUs.
 
@@ -275,136 +622,37 @@ class LabeledMetricsBuilder(MetricBuilder):
         if not gpus:
             return 'unknown'
 
-        # Extract all GPU types
-        gpu_types = [self._extract_gpu_type(gpu) for gpu in gpus]
-        unique_types = set(gpu_types)
+        return self._select_primary_gpu(self._count_gpu_types(gpus))
 
-        # Select based on priority (newest first)
-        for priority_gpu in self.gpu_priority:
-            if priority_gpu in unique_types:
-                return priority_gpu
+    def _select_primary_gpu(self, gpu_type_counts: Counter) -> str:
+        """Select the primary GPU by this builder's priority (see module-level _select_primary_gpu)."""
+        return _select_primary_gpu(gpu_type_counts, self._gpu_priority_rank)
 
-        # If no match in priority list, use most common
-        # (Fallback for unknown GPU types)
-        gpu_counts = {}
-        for gpu_type in gpu_types:
-            gpu_counts[gpu_type] = gpu_counts.get(gpu_type, 0) + 1
-
-        # Return most common (or first if tied)
-        primary = max(gpu_counts.items(), key=lambda x: (x[1], x[0]))[0]
-        return primary
-
-    def _count_gpu_types(self, gpus: list) -> Dict[str, int]:
+    def _count_gpu_types(self, gpus: list) -> Counter:
         """Count each GPU type in the list.
 
         Args:
             gpus: List of GPU names (e.g., ['NVIDIA A100', 'NVIDIA A100', 'NVIDIA V100'])
 
         Returns:
-            Dictionary mapping GPU type to count (e.g., {'A100': 2, 'V100': 1})
+            Counter mapping GPU type to count (e.g., {'A100': 2, 'V100': 1})
         """
-        gpu_counts: Dict[str, int] = {}
-        for gpu in gpus:
-            gpu_type = self._extract_gpu_type(gpu)
-            gpu_counts[gpu_type] = gpu_counts.get(gpu_type, 0) + 1
-        return gpu_counts
+        # Jobs usually repeat one GPU name, so normalize/classify each distinct name once
+        gpu_type_counts: Counter = Counter()
+        for gpu_name, count in Counter(map(str, gpus)).items():
+            gpu_type_counts[self._extract_gpu_type(gpu_name)] += count
+        return gpu_type_counts
 
     def _extract_gpu_type(self, gpu_name: str) -> str:
-        """Extract GPU type from GPU name.
-
-        Extracts the model identifier from full GPU name, handling various formats
-        including datacenter GPUs, consumer GPUs, RTX series, and Jetson devices.
+        """Extract GPU type from GPU name (see module-level _extract_gpu_type).
 
         Args:
-            gpu_name: Full GPU name (e.g., 'NVIDIA A100 40GB', 'GeForce RTX 4090', 'Jetson Orin')
+            gpu_name: Full GPU name (e.g., 'NVIDIA A100 40GB')
 
         Returns:
-            Simplified GPU type (e.g., 'A100', 'RTX4090', 'GH200', 'ORIN')
-
-        Examples:
-            >>> _extract_gpu_type('NVIDIA A100 40GB')
-            'A100'
-            >>> _extract_gpu_type('GeForce RTX 4090')
-            'RTX4090'
-            >>> _extract_gpu_type('NVIDIA GH200')
-            'GH200'
-            >>> _extract_gpu_type('NVIDIA RTX A6000')
-            'RTXA6000'
-            >>> _extract_gpu_type('Jetson AGX Orin')
-            'ORIN'
-            >>> _extract_gpu_type('NVIDIA L40S')
-            'L40S'
+            Simplified GPU type (e.g., 'A100')
         """
-        # Normalize: uppercase, replace spaces and dashes with underscores
-        gpu_upper = str(gpu_name).upper().replace(' ', '_').replace('-', '_')
-
-        # Special handling for specific GPU families
-        if 'SPARK' in gpu_upper:
-            return 'SPARK'
-        # Grace Blackwell / Grace Hopper (GB/GH prefix)
-        for model in ['GB300', 'GB200', 'GB100', 'GH200', 'GH100']:
-            if model in gpu_upper:
-                return model
-
-        # Blackwell / Hopper (B200, B300, H200, H100)
-        for model in ['B300', 'B200', 'B100', 'H200', 'H100']:
-            if model in gpu_upper:
-                return model
-
-        # RTX series (consumer and pro)
-        # RTX 5090, RTX 4090, RTX A6000, etc.
-        if 'RTX' in gpu_upper:
-            # Extract RTX model
-            parts = gpu_upper.split('_')
-            for i, part in enumerate(parts):
-                if part == 'RTX' and i + 1 < len(parts):
-                    # Next part is the model (e.g., '5090', 'A6000', '4090')
-                    model = parts[i + 1]
-                    # Remove 'TI' suffix if present
-                    model = model.replace('TI', '')
-                    # Remove 'ADA' suffix if present (e.g., "RTX 6000 Ada")
-                    model = model.replace('ADA', '')
-                    return f'RTX{model}'
-
-        # Jetson and embedded series (Orin, Xavier, Nano, Thor, etc.)
-        if 'JETSON' in gpu_upper or 'THOR' in gpu_upper or 'ORIN' in gpu_upper:
-            # Jetson T5000, T4000 (e.g., Jetson Thor models)
-            for part in gpu_upper.split('_'):
-                if part.startswith('T') and any(c.isdigit() for c in part):
-                    return part
-            if 'THOR' in gpu_upper:
-                return 'THOR'
-            if 'ORIN' in gpu_upper:
-                return 'ORIN'
-
-        # L-series (L40S, L40, L4)
-        if 'L40S' in gpu_upper:
-            return 'L40S'
-        if 'L40' in gpu_upper:
-            return 'L40'
-        if 'L4' in gpu_upper:
-            return 'L4'
-
-        # Standard datacenter/consumer GPUs (A100, V100, T4, P100, etc.)
-        # Find part with both letters and numbers
-        parts = gpu_upper.split('_')
-        for part in parts:
-            # Skip common prefixes
-            if part in ['NVIDIA', 'GEFORCE', 'QUADRO', 'TESLA', 'JETSON', 'TITAN']:
-                continue
-
-            # Look for model identifier (has both letters and numbers)
-            if any(c.isdigit() for c in part) and any(c.isalpha() for c in part):
-                # Found model like A100, V100, T4, P100, K80, etc.
-                return part
-
-        # If still no match, return first non-common part
-        for part in parts:
-            if part and part not in ['NVIDIA', 'GEFORCE', 'QUADRO', 'TESLA']:
-                return part
-
-        # Fallback to sanitized original name
-        return gpu_upper.replace('NVIDIA_', '').replace('GEFORCE_', '')
+        return _extract_gpu_type(str(gpu_name))
 
     def _build_metric_key(self, metric_name: str, labels: Dict[str, str]) -> str:
         """Build Prometheus-style metric key with labels.
@@ -426,8 +674,20 @@ class LabeledMetricsBuilder(MetricBuilder):
         if not labels:
             return metric_name
 
-        # Sort labels alphabetically for consistency
-        sorted_labels = sorted(labels.items())
-        label_str = ','.join(f'{k}="{v}"' for k, v in sorted_labels)
+        # Single-label fast path (e.g. tao_job_gpu_total)
+        if len(labels) == 1:
+            (key, value), = labels.items()
+            return f'{metric_name}{{{key}="{value}"}}'
 
-        return f'{metric_name}{{{label_str}}}'
+        return f'{metric_name}{{{self._build_label_str(labels)}}}'
+
+    def _build_label_str(self, labels: Dict[str, str]) -> str:
+        """Render labels as the comma-separated body of a Prometheus metric key.
+
+        Args:
+            labels: Dictionary of label key-value pairs
+
+        Returns:
+            Labels in format: label1="value1",label2="value2" (sorted by key)
+        """
+        return _label_template(tuple(labels)).format_map(labels)
@@ -14,13 +14,38 @@
 
 """Legacy metrics builder for backward compatibility."""
 
-from typing import Any, Dict
+import functools
+from collections import Counter
+from typing import Any, Dict, Iterable, Tuple
 
 from nvidia_tao_core.telemetry.builders.base import MetricBuilder
 from nvidia_tao_core.telemetry.types import TelemetryData
 from nvidia_tao_core.telemetry.utils import sanitize_field_value
 
 
+@functools.lru_cache(maxsize=1024)
+def _legacy_keys(action: str, version: str, network: str, success: bool) -> Tuple[str, str, str]:
+    """Build the status, version and network counter keys for an event.
+
+    Memoized because the same few action/version/network combinations repeat,
+    so repeated events reuse the same key strings instead of formatting new ones.
+
+    Args:
+        action: Sanitized action
+        version: Sanitized version
+        network: Sanitized network
+        success: Whether the job succeeded
+
+    Returns:
+        Tuple of (status key, version-action key, network-action key)
+    """
+    return (
+        f'total_action_{action}_{"pass" if success else "fail"}',
+        f'version_{version}_action_{action}',
+        f'network_{network}_action_{action}',
+    )
+
+
 class LegacyMetricsBuilder(MetricBuilder):
     """Builder for legacy metric counters (backward compatibility).
 
@@ -34,6 +59,8 @@ class LegacyMetricsBuilder(MetricBuilder):
     dashboards and monitoring systems.
     """
 
+    __slots__ = ()
+
     def build(
         self,
         metrics: Dict[str, Any],
@@ -48,24 +75,53 @@ class LegacyMetricsBuilder(MetricBuilder):
             context: Additional context (unused by this builder)
         """
         action = telemetry_data['action']
-        version = telemetry_data['version']
-        network = telemetry_data['network']
-        success = telemetry_data['success']
-
-        # Update pass/fail counters
-        status_key = f'total_action_{action}_{"pass" if success else "fail"}'
-        metrics[status_key] = metrics.get(status_key, 0) + 1
-
-        # Update version-action counters
-        version_key = f'version_{version}_action_{action}'
-        metrics[version_key] = metrics.get(version_key, 0) + 1
 
-        # Update network-action counters
-        network_key = f'network_{network}_action_{action}'
-        metrics[network_key] = metrics.get(network_key, 0) + 1
+        # Update pass/fail, version-action and network-action counters
+        for key in _legacy_keys(
+            action,
+            telemetry_data['version'],
+            telemetry_data['network'],
+            bool(telemetry_data['success'])
+        ):
+            metrics[key] = metrics.get(key, 0) + 1
 
         # Update per-GPU counters
         for gpu in telemetry_data['gpus']:
-            sanitized_gpu = sanitize_field_value(gpu)
-            gpu_key = f'gpu_{sanitized_gpu}_action_{action}'
+            gpu_key = f'gpu_{sanitize_field_value(gpu)}_action_{action}'
             metrics[gpu_key] = metrics.get(gpu_key, 0) + 1
+
+    def build_many(
+        self,
+        metrics: Dict[str, Any],
+        events: Iterable[TelemetryData],
+        context: Dict[str, Any]
+    ) -> None:
+        """Build legacy metrics for several events.
+
+        Counts are aggregated per key across the events first, then merged into
+        metrics once per key.
+
+        Args:
+            metrics: Metrics dictionary to update
+            events: Normalized telemetry data for each event
+            context: Additional context (unused by this builder)
+        """
+        counts: Counter = Counter()
+
+        for telemetry_data in events:
+            action = telemetry_data['action']
+
+            # Pass/fail, version-action and network-action counters
+            counts.update(_legacy_keys(
+                action,
+                telemetry_data['version'],
+                telemetry_data['network'],
+                bool(telemetry_data['success'])
+            ))
+
+            # Per-GPU counters (one key per distinct GPU name, incremented by its count)
+            for gpu, count in Counter(map(str, telemetry_data['gpus'])).items():
+                counts[f'gpu_{sanitize_field_value(gpu)}_action_{action}'] += count
+
+        for key, count in counts.items():
+            metrics[key] = metrics.get(key, 0) + count
@@ -15,7 +15,7 @@
 """Time-based metrics builder."""
 
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 from nvidia_tao_core.telemetry.builders.base import MetricBuilder
 from nvidia_tao_core.telemetry.types import TelemetryData
@@ -28,6 +28,8 @@ class TimeMetricsBuilder(MetricBuilder):
     This is useful for tracking daily usage patterns and resource consumption.
     """
 
+    __slots__ = ()
+
     def build(
         self,
         metrics: Dict[str, Any],
@@ -43,12 +45,46 @@ class TimeMetricsBuilder(MetricBuilder):
             telemetry_data: Normalized telemetry data
             context: Additional context including 'now' and 'old_now' timestamps
         """
-        time_lapsed = telemetry_data.get('time_lapsed', 0)
+        self._add_time_lapsed(metrics, telemetry_data.get('time_lapsed', 0), context)
+
+    def build_many(
+        self,
+        metrics: Dict[str, Any],
+        events: Iterable[TelemetryData],
+        context: Dict[str, Any]
+    ) -> None:
+        """Build time-based metrics for several events sharing one context.
+
+        The day-boundary reset applies once to the whole batch, so the batch
+        total is added in a single update.
+
+        Args:
+            metrics: Metrics dictionary to update
+            events: Normalized telemetry data for each event
+            context: Additional context including 'now' and 'old_now' timestamps
+        """
+        total = sum(telemetry_data.get('time_lapsed', 0) for telemetry_data in events)
+        self._add_time_lapsed(metrics, total, context)
+
+    def _add_time_lapsed(
+        self,
+        metrics: Dict[str, Any],
+        time_lapsed: int,
+        context: Dict[str, Any]
+    ) -> None:
+        """Add time_lapsed to today's total, resetting it on a new day.
+
+        Args:
+            metrics: Metrics dictionary to update
+            time_lapsed: Time to add, in seconds
+            context: Additional context including 'now' and 'old_now' timestamps
+        """
         now = context.get('now', datetime.now())
         old_now = context.get('old_now', now)
 
         # Reset daily counter if day changed
-        if now.strftime("%d") != old_now.strftime("%d"):
+        # (compare day-of-month directly rather than formatting both dates)
+        if now.day != old_now.day:
             metrics['time_lapsed_today'] = time_lapsed
         else:
             metrics['time_lapsed_today'] = metrics.get('time_lapsed_today', 0) + time_lapsed
@@ -15,7 +15,7 @@
 """Metric processor for orchestrating telemetry metric building."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from nvidia_tao_core.telemetry.builders import (
     ComprehensiveMetricsBuilder,
@@ -51,6 +51,8 @@ class MetricProcessor:
         >>> processor.add_builder(AlertMetricsBuilder())
     """
 
+    __slots__ = ('builders', '_frozen')
+
     def __init__(self, builders: Optional[List[MetricBuilder]] = None):
         """Initialize processor with builders.
 
@@ -59,7 +61,9 @@ class MetricProcessor:
                      (Legacy, Comprehensive, Time, and Labeled builders).
         """
         if builders is None:
-            # Default builders - includes both old (backward compat) and new (labeled)
+            # Default builders - includes both old (backward compat) and new (labeled).
+            # Built per processor: the builders carry configuration (e.g. the labeled
+            # builder's gpu_priority) that must not leak between processors.
             self.builders = [
                 LegacyMetricsBuilder(),           # Keep for old dashboards
                 ComprehensiveMetricsBuilder(),    # Keep for old dashboards
@@ -69,6 +73,8 @@ class MetricProcessor:
         else:
             self.builders = builders
 
+        self._frozen = False
+
     def add_builder(self, builder: MetricBuilder) -> None:
         """Add a new metric builder.
 
@@ -76,9 +82,23 @@ class MetricProcessor:
 
         Args:
             builder: Metric builder to add
+
+        Raises:
+            RuntimeError: If the processor has been frozen
         """
+        if self._frozen:
+            raise RuntimeError("Cannot add a builder to a frozen MetricProcessor")
         self.builders.append(builder)
 
+    def freeze(self) -> None:
+        """Fix the builder list once configuration is complete.
+
+        Stores the builders as a tuple, which is cheaper to iterate on every
+        process() call and cannot be modified by accident.
+        """
+        self.builders = tuple(self.builders)
+        self._frozen = True
+
     def process(
         self,
         metrics: Dict[str, Any],
@@ -93,19 +113,89 @@ class MetricProcessor:
         3. Updates timestamps
 
         Args:
-            metrics: Existing metrics dictionary to update
+            metrics: Existing metrics dictionary to update in place. Builders only
+                read it with .get(), so a plain dict loaded from storage and a
+                collections.defaultdict(int) are handled the same way
             raw_data: Raw telemetry data from request
+            context: Additional context (timestamps, configuration, etc.). The
+                timestamp entries ('now', 'now_iso', 'old_now') are filled into this
+                dict in place, so pass a new dict per call. Callers that already hold
+                the previous update time as a datetime can pass it as 'old_now' to
+                skip parsing metrics['last_updated']
+
+        Returns:
+            Updated metrics dictionary
+        """
+        context = self._prepare_context(metrics, context)
+
+        # Extract and normalize telemetry data
+        telemetry_data = extract_telemetry_data(raw_data)
+
+        # Run all builders
+        for builder in self.builders:
+            builder.build(metrics, telemetry_data, context)
+
+        # Update timestamp
+        metrics['last_updated'] = context['now_iso']
+
+        return metrics
+
+    def process_batch(
+        self,
+        metrics: Dict[str, Any],
+        raw_events: Iterable[Dict[str, Any]],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Process several telemetry events and update metrics once.
+
+        Equivalent to calling process() for each event with the same timestamp,
+        but the context is prepared once and each builder receives all events
+        through MetricBuilder.build_many().
+
+        Args:
+            metrics: Existing metrics dictionary to update in place
+            raw_events: Raw telemetry data for each event
             context: Additional context (timestamps, configuration, etc.)
 
         Returns:
             Updated metrics dictionary
         """
+        context = self._prepare_context(metrics, context)
+
+        # Extract and normalize every event once; all builders share the results
+        events = [extract_telemetry_data(raw_data) for raw_data in raw_events]
+
+        # Run all builders
+        for builder in self.builders:
+            builder.build_many(metrics, events, context)
+
+        # Update timestamp
+        metrics['last_updated'] = context['now_iso']
+
+        return metrics
+
+    def _prepare_context(
+        self,
+        metrics: Dict[str, Any],
+        context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Fill in the 'now', 'now_iso' and 'old_now' timestamps of the builder context.
+
+        Args:
+            metrics: Existing metrics dictionary (read for 'last_updated')
+            context: Caller-provided context (updated in place, not copied), or None
+
+        Returns:
+            Context dictionary with 'now', 'now_iso' and 'old_now' set
+        """
         if context is None:
             context = {}
 
         # Ensure timestamps are in context
         if 'now' not in context:
             context['now'] = datetime.now()
+        # ISO form of 'now', formatted once for last_updated and any builder that needs it
+        context['now_iso'] = context['now'].isoformat()
         if 'old_now' not in context:
             old_now_iso = metrics.get('last_updated')
             context['old_now'] = (
@@ -113,14 +203,4 @@ class MetricProcessor:
                 else context['now']
             )
 
-        # Extract and normalize telemetry data
-        telemetry_data = extract_telemetry_data(raw_data)
-
-        # Run all builders
-        for builder in self.builders:
-            builder.build(metrics, telemetry_data, context)
-
-        # Update timestamp
-        metrics['last_updated'] = context['now'].isoformat()
-
-        return metrics
+        return context
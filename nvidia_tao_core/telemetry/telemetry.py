@@ -37,6 +37,12 @@ except Exception as e:
 TAO_SERVER_URL = "https://api.tao.ngc.nvidia.com"
 TELEMETRY_TIMEOUT = int(os.getenv("TELEMETRY_TIMEOUT", "30"))
 
+# Log messages emitted around each report
+START_MESSAGE = "================> Start Reporting Telemetry <================"
+END_MESSAGE = "================> End Reporting Telemetry <================"
+OPT_OUT_MESSAGE = "Opted out of telemetry reporting. Skipped."
+SUCCESS_MESSAGE = "Telemetry sent successfully."
+
 
 def send_telemetry_data(
     network: str,
@@ -73,7 +79,7 @@ def send_telemetry_data(
     Returns:
         No explicit returns.
     """
-    logging.info("================> Start Reporting Telemetry <================")
+    logging.info(START_MESSAGE)
 
     if os.getenv('TELEMETRY_OPT_OUT', "no").lower() in ["no", "false", "0"]:
         url = os.getenv("TAO_TELEMETRY_SERVER", TAO_SERVER_URL)
@@ -104,8 +110,8 @@ def send_telemetry_data(
             if response:
                 logging.info(f"Failed with reponse: {response}")
             else:
-                logging.info("Telemetry sent successfully.")
+                logging.info(SUCCESS_MESSAGE)
     else:
-        logging.info("Opted out of telemetry reporting. Skipped.")
+        logging.info(OPT_OUT_MESSAGE)
 
-    logging.info("================> End Reporting Telemetry <================")
+    logging.info(END_MESSAGE)
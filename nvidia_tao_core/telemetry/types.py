@@ -32,6 +32,10 @@ class TelemetryData(TypedDict, total=False):
         gpus: List of GPU names
         client_type: Client type (container, api, cli, sdk, ui, etc.)
         automl_triggered: Whether job is triggered by AutoML
+
+    This stays a plain dict rather than a slotted dataclass: MetricProcessor
+    extracts it once per event and passes the same object to every builder,
+    and custom builders and tests read it with .get() for optional fields.
     """
 
     version: str
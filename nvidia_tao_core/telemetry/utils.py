@@ -14,7 +14,10 @@
 
 """Utility functions for telemetry data processing."""
 
+import functools
 import re
+import string
+from collections import Counter
 from typing import Any, Dict, List
 
 from nvidia_tao_core.telemetry.config import METRIC_ATTRIBUTES
@@ -23,6 +26,11 @@ from nvidia_tao_core.telemetry.types import AttributeType, TelemetryData
 
 # Constants
 TELEMETRY_SANITIZE_PATTERN = r"[^a-zA-Z0-9]"
+_TELEMETRY_SANITIZE_RE = re.compile(TELEMETRY_SANITIZE_PATTERN)
+# Same replacement as TELEMETRY_SANITIZE_PATTERN, restricted to ASCII input
+_ASCII_SANITIZE_TABLE = str.maketrans({
+    chr(c): "_" for c in range(128) if chr(c) not in string.ascii_letters + string.digits
+})
 
 
 def sanitize_field_value(value: Any, uppercase: bool = False) -> str:
@@ -35,10 +43,47 @@ def sanitize_field_value(value: Any, uppercase: bool = False) -> str:
     Returns:
         Sanitized string value
     """
-    sanitized = re.sub(TELEMETRY_SANITIZE_PATTERN, "_", str(value))
+    return _sanitize_str(str(value), uppercase)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_str(value: str, uppercase: bool) -> str:
+    """Sanitize an already stringified field value.
+
+    Memoized because telemetry only carries a few distinct networks, versions
+    and GPU names, so repeated values skip the regex substitution.
+
+    Args:
+        value: The string to sanitize
+        uppercase: Whether to convert to uppercase
+
+    Returns:
+        Sanitized string value
+    """
+    if value.isascii():
+        if value.isalnum():
+            # Nothing to replace, only the case may change
+            return value.upper() if uppercase else value.lower()
+        sanitized = value.translate(_ASCII_SANITIZE_TABLE)
+    else:
+        sanitized = _TELEMETRY_SANITIZE_RE.sub("_", value)
     return sanitized.upper() if uppercase else sanitized.lower()
 
 
+def _identity(value: Any) -> Any:
+    """Return the value unchanged (extractor for non-string attributes)."""
+    return value
+
+
+# (name, raw key, default, extractor) per configured attribute, resolved once at
+# import: STRING attributes are sanitized to lowercase, other types used as-is
+_EXTRACTION_PLAN = tuple(
+    (attr.name, attr.raw_key, attr.default,
+     sanitize_field_value if attr.attr_type == AttributeType.STRING else _identity)
+    for attr in METRIC_ATTRIBUTES
+)
+
+
 def create_gpu_identifier(gpu_list: List[str]) -> str:
     """Create a unique identifier for a list of GPUs.
 
@@ -52,13 +97,13 @@ def create_gpu_identifier(gpu_list: List[str]) -> str:
         >>> create_gpu_identifier(['NVIDIA A100', 'NVIDIA A100', 'NVIDIA V100'])
         '3_NVIDIA_A100_2_NVIDIA_V100_1'
     """
-    gpu_counts: Dict[str, int] = {}
-    for gpu in gpu_list:
-        sanitized_gpu = sanitize_field_value(gpu, uppercase=True)
-        gpu_counts[sanitized_gpu] = gpu_counts.get(sanitized_gpu, 0) + 1
-
-    gpu_parts = [f"{gpu}_{count}" for gpu, count in sorted(gpu_counts.items())]
-    return f"{len(gpu_list)}_{'_'.join(gpu_parts)}"
+    # Sanitize each distinct GPU name once; names that sanitize alike share a count
+    gpu_counts: Counter = Counter()
+    for gpu, count in Counter(map(str, gpu_list)).items():
+        gpu_counts[sanitize_field_value(gpu, uppercase=True)] += count
+    return f"{len(gpu_list)}_" + "_".join(
+        f"{gpu}_{count}" for gpu, count in sorted(gpu_counts.items())
+    )
 
 
 def extract_telemetry_data(raw_data: Dict[str, Any]) -> TelemetryData:
@@ -82,17 +127,9 @@ def extract_telemetry_data(raw_data: Dict[str, Any]) -> TelemetryData:
         >>> data['network']
         'resnet_50'
     """
-    result: Dict[str, Any] = {}
-
-    for attr in METRIC_ATTRIBUTES:
-        raw_value = raw_data.get(attr.raw_key, attr.default)
-
-        # STRING types are sanitized to lowercase; other types used as-is
-        if attr.attr_type == AttributeType.STRING:
-            value = sanitize_field_value(raw_value)
-        else:
-            value = raw_value
-
-        result[attr.name] = value
+    result: Dict[str, Any] = {
+        name: extract(raw_data.get(raw_key, default))
+        for name, raw_key, default, extract in _EXTRACTION_PLAN
+    }
 
     return result  # type: ignore[return-value]
@@ -14,14 +14,52 @@
 
 """Unit tests for telemetry.send_telemetry_data function."""
 
-import os
 import pytest
-from unittest.mock import patch, MagicMock
-
-
-@pytest.fixture
+from unittest.mock import call, patch, MagicMock
+
+from nvidia_tao_core.telemetry.telemetry import (
+    END_MESSAGE,
+    OPT_OUT_MESSAGE,
+    START_MESSAGE,
+    SUCCESS_MESSAGE,
+    send_telemetry_data,
+)
+
+TELEMETRY_ENV_VARS = (
+    "TELEMETRY_OPT_OUT",
+    "TAO_TELEMETRY_SERVER",
+    "TAO_TOOLKIT_VERSION",
+    "TAO_CLIENT_TYPE",
+    "TAO_AUTOML_TRIGGERED",
+)
+
+START_CALL = call(START_MESSAGE)
+END_CALL = call(END_MESSAGE)
+OPT_OUT_CALL = call(OPT_OUT_MESSAGE)
+SUCCESS_CALL = call(SUCCESS_MESSAGE)
+
+
+def send_once(gpu_data, network="test_network", action="train", num_gpus=1, **kwargs):
+    """Call send_telemetry_data with the defaults shared by most tests."""
+    send_telemetry_data(
+        network=network,
+        action=action,
+        gpu_data=gpu_data,
+        num_gpus=num_gpus,
+        **kwargs
+    )
+
+
+def assert_banners_logged(mock_logging):
+    """Assert that the start and end reporting banners were logged."""
+    info_calls = mock_logging.info.mock_calls
+    assert START_CALL in info_calls
+    assert END_CALL in info_calls
+
+
+@pytest.fixture(scope="module")
 def sample_gpu_data():
-    """Sample GPU data for testing."""
+    """Sample GPU data for testing (shared read-only across the module)."""
     return [
         {"name": "NVIDIA A100", "memory": "40GB"},
         {"name": "NVIDIA A100", "memory": "40GB"},
@@ -29,106 +67,111 @@ def sample_gpu_data():
     ]
 
 
-@pytest.fixture
-def mock_metrics():
-    """Mock metrics module for testing."""
+@pytest.fixture(autouse=True)
+def telemetry_env(monkeypatch):
+    """Clear telemetry environment variables so each test starts from defaults."""
+    for key in TELEMETRY_ENV_VARS:
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture(scope="class")
+def metrics_patch():
+    """Patch the metrics module once per test class."""
     with patch('nvidia_tao_core.telemetry.telemetry.METRICS_MODULE_EXISTS', True):
         with patch('nvidia_tao_core.telemetry.telemetry.metrics') as mock:
-            mock.report = MagicMock(return_value=None)
             yield mock
 
 
-@pytest.fixture
-def mock_logging():
-    """Mock logging for testing."""
+@pytest.fixture(scope="class")
+def logging_patch():
+    """Patch logging once per test class."""
     with patch('nvidia_tao_core.telemetry.telemetry.logging') as mock:
         yield mock
 
 
-class TestSendTelemetryData:
-    """Test cases for send_telemetry_data function."""
+@pytest.fixture
+def mock_metrics(metrics_patch):
+    """Mock metrics module for testing, reset before each test."""
+    metrics_patch.reset_mock()
+    metrics_patch.report = MagicMock(return_value=None)
+    return metrics_patch
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "yes"}, clear=False)
-    def test_telemetry_opt_out_yes(self, mock_logging, sample_gpu_data):
-        """Test that telemetry is skipped when opted out with 'yes'."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
 
+@pytest.fixture
+def mock_logging(logging_patch):
+    """Mock logging for testing, reset before each test."""
+    logging_patch.reset_mock()
+    return logging_patch
+
+
+@pytest.fixture(scope="class")
+def successful_send(metrics_patch, logging_patch, sample_gpu_data):
+    """Send one successful 2-GPU report per class and snapshot the recorded calls.
+
+    Returns:
+        Tuple of (metrics.report call list, logging.info call list)
+    """
+    metrics_patch.report = MagicMock(return_value=None)
+    logging_patch.reset_mock()
+    with pytest.MonkeyPatch.context() as mp:
+        for key in TELEMETRY_ENV_VARS:
+            mp.delenv(key, raising=False)
+        mp.setenv("TELEMETRY_OPT_OUT", "no")
         send_telemetry_data(
-            network="test_network",
+            network="resnet50",
             action="train",
             gpu_data=sample_gpu_data,
-            num_gpus=1
+            num_gpus=2,
+            time_lapsed=3600,
+            pass_status=True,
+            user_error=False
         )
+    return list(metrics_patch.report.call_args_list), list(logging_patch.info.mock_calls)
 
-        # Verify opt-out message is logged
-        mock_logging.info.assert_any_call("Opted out of telemetry reporting. Skipped.")
-
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "true"}, clear=False)
-    def test_telemetry_opt_out_true(self, mock_logging, sample_gpu_data):
-        """Test that telemetry is skipped when opted out with 'true'."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
-
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
 
-        mock_logging.info.assert_any_call("Opted out of telemetry reporting. Skipped.")
+class TestSendTelemetryData:
+    """Test cases for send_telemetry_data function."""
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "1"}, clear=False)
-    def test_telemetry_opt_out_one(self, mock_logging, sample_gpu_data):
-        """Test that telemetry is skipped when opted out with '1'."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+    @pytest.mark.parametrize("opt_out_value", ["yes", "true", "1"])
+    def test_telemetry_opt_out(self, opt_out_value, mock_logging, sample_gpu_data, telemetry_env):
+        """Test that telemetry is skipped when opted out."""
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", opt_out_value)
 
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
+        send_once(sample_gpu_data)
 
-        mock_logging.info.assert_any_call("Opted out of telemetry reporting. Skipped.")
+        # Verify opt-out message is logged
+        assert OPT_OUT_CALL in mock_logging.info.mock_calls
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_sent_successfully(self, mock_metrics, mock_logging, sample_gpu_data):
+    def test_telemetry_sent_successfully(self, successful_send):
         """Test successful telemetry reporting."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
-
-        # Mock successful response (None means success)
-        mock_metrics.report.return_value = None
-
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=2,
-            time_lapsed=120,
-            pass_status=True,
-            user_error=False
-        )
+        report_calls, info_calls = successful_send
 
         # Verify metrics.report was called
-        mock_metrics.report.assert_called_once()
-        call_args = mock_metrics.report.call_args
+        assert len(report_calls) == 1
+        data = report_calls[0].kwargs['data']
 
         # Verify data structure
-        assert call_args[1]['data']['network'] == "test_network"
-        assert call_args[1]['data']['action'] == "train"
-        assert call_args[1]['data']['gpu'] == ["NVIDIA A100", "NVIDIA A100"]
-        assert call_args[1]['data']['success'] is True
-        assert call_args[1]['data']['user_error'] is False
-        assert call_args[1]['data']['time_lapsed'] == 120
-        assert call_args[1]['data']['version'] == "5.3.0"
+        expected = {
+            'network': "resnet50",
+            'action': "train",
+            'gpu': ["NVIDIA A100", "NVIDIA A100"],
+            'success': True,
+            'user_error': False,
+            'time_lapsed': 3600,
+            'version': "5.3.0",
+        }
+        assert expected.items() <= data.items()
+        # True == 1 in the subset check above, so pin the boolean fields by identity
+        assert data['success'] is True
+        assert data['user_error'] is False
 
         # Verify success message is logged
-        mock_logging.info.assert_any_call("Telemetry sent successfully.")
+        assert SUCCESS_CALL in info_calls
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_sent_with_failure_response(self, mock_metrics, mock_logging, sample_gpu_data):
+    def test_telemetry_sent_with_failure_response(self, mock_metrics, mock_logging, sample_gpu_data, telemetry_env):
         """Test telemetry reporting with failure response."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", "no")
 
         # Mock error response
         mock_metrics.report.return_value = "error 500"
@@ -143,231 +186,138 @@ class TestSendTelemetryData:
         )
 
         # Verify error message is logged
-        mock_logging.info.assert_any_call("Failed with reponse: error 500")
+        assert call("Failed with reponse: error 500") in mock_logging.info.mock_calls
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_without_time_lapsed(self, mock_metrics, sample_gpu_data):
+    def test_telemetry_without_time_lapsed(self, mock_metrics, sample_gpu_data, telemetry_env):
         """Test telemetry without time_lapsed parameter."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", "no")
 
         mock_metrics.report.return_value = None
 
-        send_telemetry_data(
-            network="test_network",
-            action="evaluate",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
+        send_once(sample_gpu_data, action="evaluate")
 
         # Verify time_lapsed is not in data when not provided
         call_args = mock_metrics.report.call_args
         assert 'time_lapsed' not in call_args[1]['data']
 
-    @patch.dict(os.environ, {
-        "TELEMETRY_OPT_OUT": "no",
-        "TAO_TOOLKIT_VERSION": "6.0.0",
-        "TAO_TELEMETRY_SERVER": "https://custom-server.com",
-    }, clear=False)
-    def test_telemetry_with_custom_env_vars(self, mock_metrics, sample_gpu_data):
+    def test_telemetry_with_custom_env_vars(self, mock_metrics, sample_gpu_data, telemetry_env):
         """Test telemetry with custom environment variables."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", "no")
+        telemetry_env.setenv("TAO_TOOLKIT_VERSION", "6.0.0")
+        telemetry_env.setenv("TAO_TELEMETRY_SERVER", "https://custom-server.com")
 
         mock_metrics.report.return_value = None
 
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
-
-        call_args = mock_metrics.report.call_args
+        send_once(sample_gpu_data)
 
-        # Verify custom version is used
-        assert call_args[1]['data']['version'] == "6.0.0"
+        call_kwargs = mock_metrics.report.call_args.kwargs
 
-        # Verify custom server URL is used
-        assert call_args[1]['base_url'] == "https://custom-server.com"
+        # Verify custom version and server URL are used
+        assert {'base_url': "https://custom-server.com"}.items() <= call_kwargs.items()
+        assert {'version': "6.0.0"}.items() <= call_kwargs['data'].items()
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_when_metrics_module_not_exists(self, mock_logging, sample_gpu_data):
+    def test_telemetry_when_metrics_module_not_exists(self, mock_logging, sample_gpu_data, telemetry_env):
         """Test telemetry when metrics module doesn't exist."""
-        with patch('nvidia_tao_core.telemetry.telemetry.METRICS_MODULE_EXISTS', False):
-            from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", "no")
 
-            send_telemetry_data(
-                network="test_network",
-                action="train",
-                gpu_data=sample_gpu_data,
-                num_gpus=1
-            )
+        with patch('nvidia_tao_core.telemetry.telemetry.METRICS_MODULE_EXISTS', False):
+            send_once(sample_gpu_data)
 
             # Verify start and end messages are logged but no telemetry is sent
-            mock_logging.info.assert_any_call("================> Start Reporting Telemetry <================")
-            mock_logging.info.assert_any_call("================> End Reporting Telemetry <================")
+            assert_banners_logged(mock_logging)
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_gpu_data_slicing(self, mock_metrics, sample_gpu_data):
+    @pytest.mark.parametrize("num_gpus, expected_gpus", [
+        (1, ["NVIDIA A100"]),
+        (2, ["NVIDIA A100", "NVIDIA A100"]),
+    ])
+    def test_telemetry_gpu_data_slicing(self, num_gpus, expected_gpus, mock_metrics, sample_gpu_data, telemetry_env):
         """Test that GPU data is properly sliced based on num_gpus."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", "no")
 
         mock_metrics.report.return_value = None
 
-        # Request 2 GPUs from 3 available
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=2
-        )
-
-        call_args = mock_metrics.report.call_args
+        # Request a subset of the 3 available GPUs
+        send_once(sample_gpu_data, num_gpus=num_gpus)
 
-        # Verify only first 2 GPU names are included
-        assert call_args[1]['data']['gpu'] == ["NVIDIA A100", "NVIDIA A100"]
-        assert len(call_args[1]['data']['gpu']) == 2
-
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "false"}, clear=False)
-    def test_telemetry_opt_in_with_false(self, mock_metrics, sample_gpu_data):
-        """Test that telemetry is sent when TELEMETRY_OPT_OUT is 'false'."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+        # Verify only the first num_gpus GPU names are included
+        assert mock_metrics.report.call_args.kwargs['data']['gpu'] == expected_gpus
 
+    @pytest.mark.parametrize("opt_out_value", ["false", "0"])
+    def test_telemetry_opt_in(self, opt_out_value, mock_metrics, sample_gpu_data, telemetry_env):
+        """Test that telemetry is sent when TELEMETRY_OPT_OUT is a falsy value."""
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", opt_out_value)
         mock_metrics.report.return_value = None
 
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
+        send_once(sample_gpu_data)
 
         # Verify metrics.report was called
         mock_metrics.report.assert_called_once()
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "0"}, clear=False)
-    def test_telemetry_opt_in_with_zero(self, mock_metrics, sample_gpu_data):
-        """Test that telemetry is sent when TELEMETRY_OPT_OUT is '0'."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
-
-        mock_metrics.report.return_value = None
-
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
-
-        # Verify metrics.report was called
-        mock_metrics.report.assert_called_once()
-
-    @patch.dict(os.environ, {}, clear=False)
     def test_telemetry_default_opt_in(self, mock_metrics, sample_gpu_data):
         """Test that telemetry is sent by default when TELEMETRY_OPT_OUT is not set."""
-        # Remove TELEMETRY_OPT_OUT if it exists
-        os.environ.pop('TELEMETRY_OPT_OUT', None)
-
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
-
+        # TELEMETRY_OPT_OUT is cleared by the autouse telemetry_env fixture
         mock_metrics.report.return_value = None
 
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
+        send_once(sample_gpu_data)
 
         # Verify metrics.report was called (default is opt-in)
         mock_metrics.report.assert_called_once()
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_with_zero_time_lapsed(self, mock_metrics, sample_gpu_data):
+    def test_telemetry_with_zero_time_lapsed(self, mock_metrics, sample_gpu_data, telemetry_env):
         """Test telemetry with time_lapsed=0 (should be included)."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", "no")
 
         mock_metrics.report.return_value = None
 
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1,
-            time_lapsed=0
-        )
+        send_once(sample_gpu_data, time_lapsed=0)
 
         call_args = mock_metrics.report.call_args
 
         # Verify time_lapsed=0 is included
         assert call_args[1]['data']['time_lapsed'] == 0
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_logging_messages(self, mock_metrics, mock_logging, sample_gpu_data):
+    def test_telemetry_logging_messages(self, mock_metrics, mock_logging, sample_gpu_data, telemetry_env):
         """Test that appropriate logging messages are generated."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", "no")
 
         mock_metrics.report.return_value = None
 
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
+        send_once(sample_gpu_data)
 
         # Verify all expected logging messages
-        mock_logging.info.assert_any_call("================> Start Reporting Telemetry <================")
-        mock_logging.info.assert_any_call("================> End Reporting Telemetry <================")
+        assert_banners_logged(mock_logging)
 
         # Verify "Sending..." message is logged
-        calls = [str(call) for call in mock_logging.info.call_args_list]
-        assert any("Sending" in str(call) for call in calls)
-
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_with_single_gpu(self, mock_metrics, sample_gpu_data):
-        """Test telemetry with single GPU."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
-
-        mock_metrics.report.return_value = None
-
-        send_telemetry_data(
-            network="test_network",
-            action="train",
-            gpu_data=sample_gpu_data,
-            num_gpus=1
-        )
-
-        call_args = mock_metrics.report.call_args
-
-        # Verify only one GPU is included
-        assert len(call_args[1]['data']['gpu']) == 1
-        assert call_args[1]['data']['gpu'] == ["NVIDIA A100"]
+        assert any("Sending" in str(info_call) for info_call in mock_logging.info.call_args_list)
 
-    @patch.dict(os.environ, {"TELEMETRY_OPT_OUT": "no"}, clear=False)
-    def test_telemetry_all_parameters(self, mock_metrics, sample_gpu_data):
-        """Test telemetry with all parameters provided."""
-        from nvidia_tao_core.telemetry.telemetry import send_telemetry_data
-
-        mock_metrics.report.return_value = None
+    def test_telemetry_all_parameters(self, mock_metrics, sample_gpu_data, telemetry_env):
+        """Test telemetry with every parameter set to a non-default value."""
+        telemetry_env.setenv("TELEMETRY_OPT_OUT", "no")
 
         send_telemetry_data(
-            network="resnet50",
-            action="train",
+            network="dino",
+            action="export",
             gpu_data=sample_gpu_data,
-            num_gpus=2,
-            time_lapsed=3600,
-            pass_status=True,
-            user_error=False
+            num_gpus=3,
+            time_lapsed=120,
+            pass_status=False,
+            user_error=True,
+            client_type="sdk",
+            automl_triggered=True
         )
 
-        call_args = mock_metrics.report.call_args
-        data = call_args[1]['data']
+        data = mock_metrics.report.call_args.kwargs['data']
 
         # Verify all parameters are correctly passed
-        assert data['network'] == "resnet50"
-        assert data['action'] == "train"
-        assert data['gpu'] == ["NVIDIA A100", "NVIDIA A100"]
-        assert data['success'] is True
-        assert data['user_error'] is False
-        assert data['time_lapsed'] == 3600
-        assert 'version' in data
+        expected = {
+            'network': "dino",
+            'action': "export",
+            'gpu': ["NVIDIA A100", "NVIDIA A100", "NVIDIA V100"],
+            'time_lapsed': 120,
+            'client_type': "sdk",
+            'version': "5.3.0",
+        }
+        assert expected.items() <= data.items()
+        assert data['success'] is False
+        assert data['user_error'] is True
+        assert data['automl_triggered'] is True
@@ -14,6 +14,8 @@
 
 """Unit tests for telemetry configuration module."""
 
+import pytest
+
 from nvidia_tao_core.telemetry.config import (
     METRIC_ATTRIBUTES,
     get_attribute_map,
@@ -21,6 +23,35 @@ from nvidia_tao_core.telemetry.config import (
 )
 from nvidia_tao_core.telemetry.types import AttributeType, MetricAttribute
 
+# METRIC_ATTRIBUTES is static for the session, so derive its projections once
+ATTRIBUTE_NAMES = [attr.name for attr in METRIC_ATTRIBUTES]
+RAW_KEYS = [attr.raw_key for attr in METRIC_ATTRIBUTES]
+ATTRIBUTES_BY_TYPE = {}
+for _attr in METRIC_ATTRIBUTES:
+    ATTRIBUTES_BY_TYPE.setdefault(_attr.attr_type, []).append(_attr)
+
+
+def has_duplicates(values):
+    """Return True as soon as a repeated value is seen."""
+    seen = set()
+    for value in values:
+        if value in seen:
+            return True
+        seen.add(value)
+    return False
+
+
+@pytest.fixture(scope="class")
+def attr_map():
+    """Attribute map built once per test class (tests only read it)."""
+    return get_attribute_map()
+
+
+@pytest.fixture(scope="class")
+def raw_key_map():
+    """Raw key map built once per test class (tests only read it)."""
+    return get_raw_key_map()
+
 
 class TestMetricAttributes:
     """Test cases for METRIC_ATTRIBUTES configuration."""
@@ -37,60 +68,50 @@ class TestMetricAttributes:
 
     def test_expected_attributes_exist(self):
         """Test that expected core attributes exist."""
-        attr_names = {attr.name for attr in METRIC_ATTRIBUTES}
+        attr_names = set(ATTRIBUTE_NAMES)
 
         expected_names = {'version', 'action', 'network', 'success', 'user_error', 'time_lapsed', 'gpus'}
         assert expected_names.issubset(attr_names), f"Missing attributes: {expected_names - attr_names}"
 
     def test_attribute_names_unique(self):
         """Test that all attribute names are unique."""
-        names = [attr.name for attr in METRIC_ATTRIBUTES]
-        assert len(names) == len(set(names)), "Duplicate attribute names found"
+        assert not has_duplicates(ATTRIBUTE_NAMES), "Duplicate attribute names found"
 
     def test_raw_keys_unique(self):
         """Test that all raw keys are unique."""
-        raw_keys = [attr.raw_key for attr in METRIC_ATTRIBUTES]
-        assert len(raw_keys) == len(set(raw_keys)), "Duplicate raw keys found"
+        assert not has_duplicates(RAW_KEYS), "Duplicate raw keys found"
 
     def test_string_attributes_configured(self):
         """Test that STRING type attributes are properly configured."""
-        string_attrs = [attr for attr in METRIC_ATTRIBUTES if attr.attr_type == AttributeType.STRING]
-
-        assert len(string_attrs) > 0, "No STRING attributes found"
+        string_attrs = ATTRIBUTES_BY_TYPE.get(AttributeType.STRING, [])
 
+        assert string_attrs, "No STRING attributes found"
         # All string attributes should have string defaults
-        for attr in string_attrs:
-            assert isinstance(attr.default, str)
+        assert all(isinstance(attr.default, str) for attr in string_attrs)
 
     def test_boolean_attributes_configured(self):
         """Test that BOOLEAN type attributes are properly configured."""
-        bool_attrs = [attr for attr in METRIC_ATTRIBUTES if attr.attr_type == AttributeType.BOOLEAN]
-
-        assert len(bool_attrs) > 0, "No BOOLEAN attributes found"
+        bool_attrs = ATTRIBUTES_BY_TYPE.get(AttributeType.BOOLEAN, [])
 
+        assert bool_attrs, "No BOOLEAN attributes found"
         # All boolean attributes should have boolean defaults
-        for attr in bool_attrs:
-            assert isinstance(attr.default, bool)
+        assert all(isinstance(attr.default, bool) for attr in bool_attrs)
 
     def test_integer_attributes_configured(self):
         """Test that INTEGER type attributes are properly configured."""
-        int_attrs = [attr for attr in METRIC_ATTRIBUTES if attr.attr_type == AttributeType.INTEGER]
-
-        assert len(int_attrs) > 0, "No INTEGER attributes found"
+        int_attrs = ATTRIBUTES_BY_TYPE.get(AttributeType.INTEGER, [])
 
+        assert int_attrs, "No INTEGER attributes found"
         # All integer attributes should have integer defaults
-        for attr in int_attrs:
-            assert isinstance(attr.default, int)
+        assert all(isinstance(attr.default, int) for attr in int_attrs)
 
     def test_list_attributes_configured(self):
         """Test that LIST type attributes are properly configured."""
-        list_attrs = [attr for attr in METRIC_ATTRIBUTES if attr.attr_type == AttributeType.LIST]
-
-        assert len(list_attrs) > 0, "No LIST attributes found"
+        list_attrs = ATTRIBUTES_BY_TYPE.get(AttributeType.LIST, [])
 
+        assert list_attrs, "No LIST attributes found"
         # All list attributes should have list defaults
-        for attr in list_attrs:
-            assert isinstance(attr.default, list)
+        assert all(isinstance(attr.default, list) for attr in list_attrs)
 
     def test_metric_order_values(self):
         """Test that metric_order values are valid."""
@@ -102,32 +123,25 @@ class TestMetricAttributes:
 class TestGetAttributeMap:
     """Test cases for get_attribute_map function."""
 
-    def test_returns_dict(self):
+    def test_returns_dict(self, attr_map):
         """Test that get_attribute_map returns a dictionary."""
-        attr_map = get_attribute_map()
         assert isinstance(attr_map, dict)
 
-    def test_maps_name_to_attribute(self):
+    def test_maps_name_to_attribute(self, attr_map):
         """Test that the map correctly maps names to MetricAttribute objects."""
-        attr_map = get_attribute_map()
-
         for name, attr in attr_map.items():
             assert isinstance(attr, MetricAttribute)
             assert attr.name == name
 
-    def test_contains_all_attributes(self):
+    def test_contains_all_attributes(self, attr_map):
         """Test that the map contains all attributes from METRIC_ATTRIBUTES."""
-        attr_map = get_attribute_map()
-
-        expected_names = {attr.name for attr in METRIC_ATTRIBUTES}
+        expected_names = set(ATTRIBUTE_NAMES)
         actual_names = set(attr_map.keys())
 
         assert expected_names == actual_names
 
-    def test_can_lookup_by_name(self):
+    def test_can_lookup_by_name(self, attr_map):
         """Test that we can look up attributes by name."""
-        attr_map = get_attribute_map()
-
         # Test a few known attributes
         if 'version' in attr_map:
             assert attr_map['version'].name == 'version'
@@ -138,42 +152,33 @@ class TestGetAttributeMap:
 class TestGetRawKeyMap:
     """Test cases for get_raw_key_map function."""
 
-    def test_returns_dict(self):
+    def test_returns_dict(self, raw_key_map):
         """Test that get_raw_key_map returns a dictionary."""
-        raw_key_map = get_raw_key_map()
         assert isinstance(raw_key_map, dict)
 
-    def test_maps_raw_key_to_attribute(self):
+    def test_maps_raw_key_to_attribute(self, raw_key_map):
         """Test that the map correctly maps raw keys to MetricAttribute objects."""
-        raw_key_map = get_raw_key_map()
-
         for raw_key, attr in raw_key_map.items():
             assert isinstance(attr, MetricAttribute)
             assert attr.raw_key == raw_key
 
-    def test_contains_all_attributes(self):
+    def test_contains_all_attributes(self, raw_key_map):
         """Test that the map contains all attributes from METRIC_ATTRIBUTES."""
-        raw_key_map = get_raw_key_map()
-
-        expected_keys = {attr.raw_key for attr in METRIC_ATTRIBUTES}
+        expected_keys = set(RAW_KEYS)
         actual_keys = set(raw_key_map.keys())
 
         assert expected_keys == actual_keys
 
-    def test_can_lookup_by_raw_key(self):
+    def test_can_lookup_by_raw_key(self, raw_key_map):
         """Test that we can look up attributes by raw key."""
-        raw_key_map = get_raw_key_map()
-
         # Test a few known attributes
         if 'version' in raw_key_map:
             assert raw_key_map['version'].raw_key == 'version'
         if 'gpu' in raw_key_map:
             assert raw_key_map['gpu'].raw_key == 'gpu'
 
-    def test_raw_key_differs_from_name(self):
+    def test_raw_key_differs_from_name(self, raw_key_map):
         """Test that we can handle cases where raw_key differs from name."""
-        raw_key_map = get_raw_key_map()
-
         # 'gpu' raw_key maps to 'gpus' name
         if 'gpu' in raw_key_map:
             assert raw_key_map['gpu'].name == 'gpus'
@@ -183,11 +188,8 @@ class TestGetRawKeyMap:
 class TestConfigurationConsistency:
     """Test cases for overall configuration consistency."""
 
-    def test_no_orphaned_attributes(self):
+    def test_no_orphaned_attributes(self, attr_map, raw_key_map):
         """Test that all attributes are accessible from both maps."""
-        attr_map = get_attribute_map()
-        raw_key_map = get_raw_key_map()
-
         # Every attribute should be in both maps
         for attr in METRIC_ATTRIBUTES:
             assert attr.name in attr_map
@@ -14,10 +14,20 @@
 
 """Unit tests for LabeledMetricsBuilder."""
 
+from collections import defaultdict
+
 from nvidia_tao_core.telemetry.builders.labeled import LabeledMetricsBuilder
 from nvidia_tao_core.telemetry.types import TelemetryData
 
 
+def keys_by_metric(metrics):
+    """Index metric keys by metric name (the part before the labels) in one pass."""
+    index = defaultdict(list)
+    for key in metrics:
+        index[key.partition('{')[0]].append(key)
+    return index
+
+
 class TestLabeledMetricsBuilder:
     """Test cases for LabeledMetricsBuilder."""
 
@@ -128,22 +138,18 @@ class TestLabeledMetricsBuilder:
         telemetry_data['time_lapsed'] = 1800
         builder.build(metrics, telemetry_data, {})
 
+        metric_keys = keys_by_metric(metrics)
+
         # Duration sum should accumulate
-        duration_key = [
-            k for k in metrics.keys() if k.startswith('tao_job_duration_sum')
-        ][0]
+        duration_key = metric_keys['tao_job_duration_sum'][0]
         assert metrics[duration_key] == 5400  # 3600 + 1800
 
         # GPU-time sum should also accumulate (1 GPU each job)
-        gpu_time_key = [
-            k for k in metrics.keys() if k.startswith('tao_job_gpu_time_sum')
-        ][0]
+        gpu_time_key = metric_keys['tao_job_gpu_time_sum'][0]
         assert metrics[gpu_time_key] == 5400  # (1×3600) + (1×1800)
 
         # Job total should also increment
-        job_key = [
-            k for k in metrics.keys() if k.startswith('tao_job_total')
-        ][0]
+        job_key = metric_keys['tao_job_total'][0]
         assert metrics[job_key] == 2
 
     def test_build_gpu_total_metric(self):
@@ -289,6 +295,29 @@ class TestLabeledMetricsBuilder:
             ['GeForce_RTX_4090', 'GeForce_RTX_3090']
         ) == 'RTX4090'
 
+    def test_extract_primary_gpu_custom_priority(self):
+        """Test that a customized gpu_priority is used to select the primary GPU."""
+        builder = LabeledMetricsBuilder()
+        builder.gpu_priority = ['V100', 'A100']
+
+        assert builder._extract_primary_gpu(
+            ['NVIDIA_A100', 'NVIDIA_V100']
+        ) == 'V100'
+
+        # Other instances keep the default order
+        assert LabeledMetricsBuilder()._extract_primary_gpu(
+            ['NVIDIA_A100', 'NVIDIA_V100']
+        ) == 'A100'
+
+    def test_count_gpu_types_unhashable_entry(self):
+        """Test that non-string GPU entries are counted by their string form."""
+        builder = LabeledMetricsBuilder()
+
+        counts = builder._count_gpu_types([{'name': 'A100'}, {'name': 'A100'}, 'NVIDIA_V100'])
+
+        assert counts[builder._extract_gpu_type(str({'name': 'A100'}))] == 2
+        assert counts['V100'] == 1
+
     def test_status_derived_from_success(self):
         """Test that status label is derived from success field."""
         builder = LabeledMetricsBuilder()
@@ -348,9 +377,7 @@ class TestLabeledMetricsBuilder:
         builder.build(metrics, telemetry_data, {})
 
         # Should have gpu_count="4"
-        job_keys = [
-            k for k in metrics.keys() if k.startswith('tao_job_total')
-        ]
+        job_keys = keys_by_metric(metrics)['tao_job_total']
         assert len(job_keys) == 1
         assert 'tao_gpu_count="4"' in job_keys[0]
 
@@ -371,9 +398,7 @@ class TestLabeledMetricsBuilder:
         builder.build(metrics, telemetry_data, {})
 
         # GPU-time = 3 GPUs × 3600 seconds = 10800 GPU-seconds
-        gpu_time_keys = [
-            k for k in metrics.keys() if k.startswith('tao_job_gpu_time_sum')
-        ]
+        gpu_time_keys = keys_by_metric(metrics)['tao_job_gpu_time_sum']
         assert len(gpu_time_keys) == 1
         assert metrics[gpu_time_keys[0]] == 10800
 
@@ -396,9 +421,7 @@ class TestLabeledMetricsBuilder:
         builder.build(metrics, telemetry_data, {})
 
         # Find the job total metric
-        job_total_keys = [
-            k for k in metrics.keys() if k.startswith('tao_job_total')
-        ]
+        job_total_keys = keys_by_metric(metrics)['tao_job_total']
         assert len(job_total_keys) == 1
 
         key = job_total_keys[0]
@@ -434,16 +457,14 @@ class TestLabeledMetricsBuilder:
         for _ in range(3):
             builder.build(metrics, telemetry_data, {})
 
+        metric_keys = keys_by_metric(metrics)
+
         # Job total should increment
-        job_total_key = [
-            k for k in metrics.keys() if k.startswith('tao_job_total')
-        ][0]
+        job_total_key = metric_keys['tao_job_total'][0]
         assert metrics[job_total_key] == 3
 
         # Duration sum should accumulate (counter behavior)
-        duration_key = [
-            k for k in metrics.keys() if k.startswith('tao_job_duration_sum')
-        ][0]
+        duration_key = metric_keys['tao_job_duration_sum'][0]
         assert metrics[duration_key] == 5400  # 1800 * 3
 
     def test_different_gpu_types(self):
@@ -479,14 +500,14 @@ class TestLabeledMetricsBuilder:
         }
         builder.build(metrics, telemetry_data_v100, {})
 
+        metric_keys = keys_by_metric(metrics)
+
         # Should have separate metrics for different primary GPUs
         a100_key = [
-            k for k in metrics.keys()
-            if 'tao_primary_gpu="A100"' in k and k.startswith('tao_job_total')
+            k for k in metric_keys['tao_job_total'] if 'tao_primary_gpu="A100"' in k
         ]
         v100_key = [
-            k for k in metrics.keys()
-            if 'tao_primary_gpu="V100"' in k and k.startswith('tao_job_total')
+            k for k in metric_keys['tao_job_total'] if 'tao_primary_gpu="V100"' in k
         ]
 
         assert len(a100_key) == 1
@@ -518,10 +539,10 @@ class TestLabeledMetricsBuilder:
 
         builder.build(metrics, telemetry_data, {})
 
+        metric_keys = keys_by_metric(metrics)
+
         # Primary GPU should be A100 (newer than V100)
-        job_keys = [
-            k for k in metrics.keys() if k.startswith('tao_job_total')
-        ]
+        job_keys = metric_keys['tao_job_total']
         assert len(job_keys) == 1
         assert 'tao_primary_gpu="A100"' in job_keys[0]
         assert 'tao_gpu_count="3"' in job_keys[0]
@@ -531,13 +552,11 @@ class TestLabeledMetricsBuilder:
         assert metrics['tao_job_gpu_total{tao_gpu_type="V100"}'] == 1
 
         # GPU-time should be 3 × 3600 = 10800
-        gpu_time_keys = [
-            k for k in metrics.keys() if k.startswith('tao_job_gpu_time_sum')
-        ]
+        gpu_time_keys = metric_keys['tao_job_gpu_time_sum']
         assert metrics[gpu_time_keys[0]] == 10800
 
     def test_no_duration_when_zero(self):
-        """Test that duration metric is not created when time_lapsed is 0."""
+        """Test that duration and GPU-time sums are not created when time_lapsed is 0."""
         builder = LabeledMetricsBuilder()
         metrics = {}
         telemetry_data: TelemetryData = {
@@ -554,12 +573,17 @@ class TestLabeledMetricsBuilder:
 
         builder.build(metrics, telemetry_data, {})
 
+        metric_keys = keys_by_metric(metrics)
+
         # Duration sum metric should not be created
-        duration_metrics = [
-            k for k in metrics.keys() if k.startswith('tao_job_duration_sum')
-        ]
+        duration_metrics = metric_keys['tao_job_duration_sum']
         assert len(duration_metrics) == 0
 
+        # GPU-time sum is skipped as well, while the counters are still emitted
+        assert not metric_keys['tao_job_gpu_time_sum']
+        assert metric_keys['tao_job_total']
+        assert metrics['tao_job_gpu_total{tao_gpu_type="A100"}'] == 1
+
     def test_average_duration_calculation(self):
         """Test that average duration can be calculated from sum and total."""
         builder = LabeledMetricsBuilder()
@@ -583,13 +607,11 @@ class TestLabeledMetricsBuilder:
         telemetry_data['time_lapsed'] = 1800
         builder.build(metrics, telemetry_data, {})
 
+        metric_keys = keys_by_metric(metrics)
+
         # Get the metrics
-        duration_sum = [
-            v for k, v in metrics.items() if k.startswith('tao_job_duration_sum')
-        ][0]
-        job_total = [
-            v for k, v in metrics.items() if k.startswith('tao_job_total')
-        ][0]
+        duration_sum = metrics[metric_keys['tao_job_duration_sum'][0]]
+        job_total = metrics[metric_keys['tao_job_total'][0]]
 
         # Calculate average
         average_duration = duration_sum / job_total
@@ -689,6 +711,113 @@ class TestLabeledMetricsBuilder:
         assert expected_key_cli in metrics
         assert metrics[expected_key_cli] == 1
 
+    def test_split_network_labels(self):
+        """Test that legacy=False moves network/GPU labels to tao_job_network_total."""
+        builder = LabeledMetricsBuilder(legacy=False)
+        metrics = {}
+        telemetry_data: TelemetryData = {
+            'version': '5_3_0',
+            'action': 'train',
+            'network': 'resnet50',
+            'success': True,
+            'user_error': False,
+            'gpus': ['NVIDIA_A100', 'NVIDIA_A100'],
+            'time_lapsed': 3600,
+            'client_type': 'container',
+            'automl_triggered': False
+        }
+
+        builder.build(metrics, telemetry_data, {})
+        builder.build(metrics, telemetry_data, {})
+
+        core_labels = (
+            'tao_action="train",tao_automl_triggered="false",'
+            'tao_client_type="container",tao_status="pass",'
+            'tao_user_error="false",tao_version="5_3_0"'
+        )
+        assert metrics[f'tao_job_total{{{core_labels}}}'] == 2
+        assert metrics[f'tao_job_duration_sum{{{core_labels}}}'] == 7200
+        assert metrics[f'tao_job_gpu_time_sum{{{core_labels}}}'] == 14400
+
+        network_key = (
+            'tao_job_network_total{tao_gpu_count="2",'
+            'tao_network="resnet50",tao_primary_gpu="A100"}'
+        )
+        assert metrics[network_key] == 2
+        assert metrics['tao_job_gpu_total{tao_gpu_type="A100"}'] == 4
+
+        # Legacy (default) builder does not emit the network counter
+        legacy_metrics = {}
+        LabeledMetricsBuilder().build(legacy_metrics, telemetry_data, {})
+        assert not keys_by_metric(legacy_metrics)['tao_job_network_total']
+
+    def test_bucket_gpu_count(self):
+        """Test that bucket_gpu_count buckets the label but not the GPU-time value."""
+        builder = LabeledMetricsBuilder(bucket_gpu_count=True)
+
+        assert [builder._bucket_gpu_count(n) for n in (1, 2, 4, 5, 8, 9, 16, 17, 64)] == [
+            '1', '2-4', '2-4', '5-8', '5-8', '9-16', '9-16', '>16', '>16'
+        ]
+
+        metrics = {}
+        telemetry_data: TelemetryData = {
+            'version': '5_3_0',
+            'action': 'train',
+            'network': 'resnet50',
+            'success': True,
+            'gpus': ['NVIDIA_A100'] * 3,
+            'time_lapsed': 100
+        }
+
+        builder.build(metrics, telemetry_data, {})
+
+        gpu_time_keys = keys_by_metric(metrics)['tao_job_gpu_time_sum']
+        assert len(gpu_time_keys) == 1
+        assert 'tao_gpu_count="2-4"' in gpu_time_keys[0]
+        assert metrics[gpu_time_keys[0]] == 300
+
+    def test_build_batch_matches_build(self):
+        """Test that build_batch and per-event build calls both produce the expected metrics."""
+        events = [
+            {'version': '5_3_0', 'action': 'train', 'network': 'resnet50', 'success': True,
+             'gpus': ['NVIDIA_A100', 'NVIDIA_A100'], 'time_lapsed': 3600},
+            {'version': '5_3_0', 'action': 'train', 'network': 'resnet50', 'success': True,
+             'gpus': ['NVIDIA_A100', 'NVIDIA_A100'], 'time_lapsed': 1800},
+            {'version': '5_3_0', 'action': 'evaluate', 'network': 'dino', 'success': False,
+             'gpus': ['NVIDIA_H100', 'NVIDIA_V100'], 'time_lapsed': 0},
+            {'version': '5_3_0', 'action': 'evaluate', 'network': 'dino', 'success': False,
+             'gpus': [], 'time_lapsed': 0},
+        ]
+        existing = {'tao_job_gpu_total{tao_gpu_type="A100"}': 10}
+
+        train_labels = (
+            'tao_action="train",tao_gpu_count="2",tao_network="resnet50",'
+            'tao_primary_gpu="A100",tao_status="pass",tao_version="5_3_0"'
+        )
+        expected = {
+            f'tao_job_total{{{train_labels}}}': 2,
+            f'tao_job_duration_sum{{{train_labels}}}': 5400,
+            f'tao_job_gpu_time_sum{{{train_labels}}}': 10800,
+            ('tao_job_total{tao_action="evaluate",tao_gpu_count="2",tao_network="dino",'
+             'tao_primary_gpu="H100",tao_status="fail",tao_version="5_3_0"}'): 1,
+            ('tao_job_total{tao_action="evaluate",tao_gpu_count="0",tao_network="dino",'
+             'tao_primary_gpu="unknown",tao_status="fail",tao_version="5_3_0"}'): 1,
+            'tao_job_gpu_total{tao_gpu_type="A100"}': 14,
+            'tao_job_gpu_total{tao_gpu_type="H100"}': 1,
+            'tao_job_gpu_total{tao_gpu_type="V100"}': 1,
+        }
+
+        builder = LabeledMetricsBuilder()
+
+        batched = dict(existing)
+        builder.build_batch(batched, events, {})
+        assert batched == expected
+
+        per_event = dict(existing)
+        for event in events:
+            builder.build(per_event, event, {})
+        assert per_event == expected
+
 
 class TestIntegrationWithOtherBuilders:
     """Test that LabeledMetricsBuilder works alongside other builders."""
@@ -14,8 +14,12 @@
 
 """Unit tests for MetricProcessor."""
 
+import re
+from collections import defaultdict
 from datetime import datetime
-from unittest.mock import Mock
+
+import pytest
+
 from nvidia_tao_core.telemetry.processor import MetricProcessor
 from nvidia_tao_core.telemetry.builders import (
     MetricBuilder,
@@ -25,6 +29,32 @@ from nvidia_tao_core.telemetry.builders import (
     LabeledMetricsBuilder
 )
 
+ISO_TIMESTAMP_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')
+
+
+@pytest.fixture(scope="module")
+def shared_processor():
+    """Default-configured processor shared by tests that do not modify its builders."""
+    return MetricProcessor()
+
+
+class RecordingBuilder(MetricBuilder):
+    """Builder stub that records build() calls without Mock's call machinery."""
+
+    def __init__(self):
+        self.call_count = 0
+        self.call_args = None
+        self.contexts = []
+
+    def build(self, metrics, telemetry_data, context):
+        # Same shape as Mock.call_args: call_args[0] is the positional args tuple
+        self.call_args = ((metrics, telemetry_data, context),)
+        self.call_count += 1
+        self.contexts.append(context)
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"build() called {self.call_count} times"
+
 
 class TestMetricProcessorInitialization:
     """Test cases for MetricProcessor initialization."""
@@ -39,6 +69,16 @@ class TestMetricProcessorInitialization:
         assert isinstance(processor.builders[2], TimeMetricsBuilder)
         assert isinstance(processor.builders[3], LabeledMetricsBuilder)
 
+    def test_default_builders_not_shared(self):
+        """Test that configuring one processor's builders does not affect another."""
+        processor = MetricProcessor()
+        processor.builders[3].gpu_priority = ['V100', 'A100']
+
+        other = MetricProcessor()
+
+        assert other.builders[3] is not processor.builders[3]
+        assert other.builders[3].gpu_priority != processor.builders[3].gpu_priority
+
     def test_custom_builders_initialization(self):
         """Test initialization with custom builders."""
         custom_builder = LegacyMetricsBuilder()
@@ -91,13 +131,26 @@ class TestMetricProcessorAddBuilder:
         assert len(processor.builders) == initial_count + 1
         assert processor.builders[-1] is custom_builder
 
+    def test_add_builder_after_freeze_raises(self):
+        """Test that freeze() fixes the builders and rejects new ones."""
+        processor = MetricProcessor()
+        processor.freeze()
+
+        assert isinstance(processor.builders, tuple)
+        assert len(processor.builders) == 4
+        with pytest.raises(RuntimeError):
+            processor.add_builder(LegacyMetricsBuilder())
+
+        result = processor.process({}, {'action': 'train', 'network': 'resnet50', 'success': True})
+        assert result['total_action_train_pass'] == 1
+
 
 class TestMetricProcessorProcess:
     """Test cases for process method."""
 
-    def test_process_basic(self):
+    def test_process_basic(self, shared_processor):
         """Test basic metric processing."""
-        processor = MetricProcessor()
+        processor = shared_processor
         metrics = {}
         raw_data = {
             'version': '5.3.0',
@@ -117,35 +170,36 @@ class TestMetricProcessorProcess:
         assert 'time_lapsed_today' in result  # Time
         assert 'last_updated' in result  # Timestamp
 
-    def test_process_updates_last_updated(self):
+    def test_process_updates_last_updated(self, shared_processor):
         """Test that process updates last_updated timestamp."""
-        processor = MetricProcessor()
+        processor = shared_processor
         metrics = {}
         raw_data = {'action': 'train', 'network': 'resnet50', 'success': True}
 
         result = processor.process(metrics, raw_data)
 
         assert 'last_updated' in result
-        # Should be a valid ISO format datetime
-        datetime.fromisoformat(result['last_updated'])
+        # Should be an ISO format datetime
+        assert ISO_TIMESTAMP_RE.match(result['last_updated'])
 
-    def test_process_with_existing_metrics(self):
+    def test_process_with_existing_metrics(self, shared_processor):
         """Test processing with existing metrics."""
-        processor = MetricProcessor()
+        processor = shared_processor
         metrics = {
             'total_action_train_pass': 5,
             'last_updated': '2025-01-01T00:00:00'
         }
         raw_data = {'action': 'train', 'network': 'resnet50', 'success': True}
 
-        result = processor.process(metrics, raw_data)
+        # Pre-parsed last_updated, so process() does not parse the stored string
+        result = processor.process(metrics, raw_data, {'old_now': datetime(2025, 1, 1)})
 
         # Should increment existing metric
         assert result['total_action_train_pass'] == 6
 
-    def test_process_with_custom_context(self):
+    def test_process_with_custom_context(self, shared_processor):
         """Test processing with custom context."""
-        processor = MetricProcessor()
+        processor = shared_processor
         metrics = {}
         raw_data = {'action': 'train', 'network': 'resnet50', 'success': True, 'time_lapsed': 100}
 
@@ -155,10 +209,14 @@ class TestMetricProcessorProcess:
         result = processor.process(metrics, raw_data, context)
 
         assert result['last_updated'] == custom_now.isoformat()
+        # The caller's context is filled in place rather than copied
+        assert context['now'] is custom_now
+        assert context['old_now'] is custom_now
+        assert context['now_iso'] == result['last_updated']
 
-    def test_process_creates_context_if_missing(self):
+    def test_process_creates_context_if_missing(self, shared_processor):
         """Test that process creates context timestamps if not provided."""
-        processor = MetricProcessor()
+        processor = shared_processor
         metrics = {}
         raw_data = {'action': 'train', 'network': 'resnet50', 'success': True}
 
@@ -173,22 +231,19 @@ class TestMetricProcessorProcess:
         metrics = {'last_updated': old_timestamp}
         raw_data = {'action': 'train', 'network': 'resnet50', 'success': True, 'time_lapsed': 100}
 
-        # Mock a builder to capture the context
-        mock_builder = Mock(spec=MetricBuilder)
-        processor.builders = [mock_builder]
+        # Stub builder to capture the context
+        capture_builder = RecordingBuilder()
+        processor.builders = [capture_builder]
 
         processor.process(metrics, raw_data)
 
-        # Verify builder was called
-        mock_builder.build.assert_called_once()
-        call_context = mock_builder.build.call_args[0][2]
-
-        assert 'old_now' in call_context
-        assert call_context['old_now'] == datetime.fromisoformat(old_timestamp)
+        # Verify builder was called once with the parsed old_now
+        assert len(capture_builder.contexts) == 1
+        assert capture_builder.contexts[0]['old_now'] == datetime.fromisoformat(old_timestamp)
 
-    def test_process_with_empty_raw_data(self):
+    def test_process_with_empty_raw_data(self, shared_processor):
         """Test processing with empty raw data (uses defaults)."""
-        processor = MetricProcessor()
+        processor = shared_processor
         metrics = {}
         raw_data = {}
 
@@ -200,9 +255,9 @@ class TestMetricProcessorProcess:
 
     def test_process_calls_all_builders(self):
         """Test that process calls all registered builders."""
-        mock_builder1 = Mock(spec=MetricBuilder)
-        mock_builder2 = Mock(spec=MetricBuilder)
-        mock_builder3 = Mock(spec=MetricBuilder)
+        mock_builder1 = RecordingBuilder()
+        mock_builder2 = RecordingBuilder()
+        mock_builder3 = RecordingBuilder()
 
         processor = MetricProcessor(builders=[mock_builder1, mock_builder2, mock_builder3])
         metrics = {}
@@ -210,14 +265,14 @@ class TestMetricProcessorProcess:
 
         processor.process(metrics, raw_data)
 
-        mock_builder1.build.assert_called_once()
-        mock_builder2.build.assert_called_once()
-        mock_builder3.build.assert_called_once()
+        mock_builder1.assert_called_once()
+        mock_builder2.assert_called_once()
+        mock_builder3.assert_called_once()
 
     def test_process_passes_same_telemetry_data_to_all_builders(self):
         """Test that all builders receive the same telemetry data."""
-        mock_builder1 = Mock(spec=MetricBuilder)
-        mock_builder2 = Mock(spec=MetricBuilder)
+        mock_builder1 = RecordingBuilder()
+        mock_builder2 = RecordingBuilder()
 
         processor = MetricProcessor(builders=[mock_builder1, mock_builder2])
         metrics = {}
@@ -226,15 +281,15 @@ class TestMetricProcessorProcess:
         processor.process(metrics, raw_data)
 
         # Extract telemetry_data passed to each builder
-        telemetry_data1 = mock_builder1.build.call_args[0][1]
-        telemetry_data2 = mock_builder2.build.call_args[0][1]
+        telemetry_data1 = mock_builder1.call_args[0][1]
+        telemetry_data2 = mock_builder2.call_args[0][1]
 
         # Should be the same data
         assert telemetry_data1 == telemetry_data2
 
-    def test_process_modifies_metrics_in_place(self):
+    def test_process_modifies_metrics_in_place(self, shared_processor):
         """Test that process modifies the metrics dict in place."""
-        processor = MetricProcessor()
+        processor = shared_processor
         metrics = {}
         raw_data = {'action': 'train', 'network': 'resnet50', 'success': True}
 
@@ -243,13 +298,34 @@ class TestMetricProcessorProcess:
         # Result should be the same object as input metrics
         assert result is metrics
 
+    def test_process_accepts_defaultdict(self, shared_processor):
+        """Test that process works the same on a defaultdict(int) metrics store."""
+        processor = shared_processor
+        raw_data = {'action': 'train', 'network': 'resnet50', 'success': True, 'gpu': ['NVIDIA A100']}
+
+        plain = processor.process({}, raw_data, {'now': datetime(2025, 1, 1)})
+        counted = processor.process(defaultdict(int), raw_data, {'now': datetime(2025, 1, 1)})
+
+        assert isinstance(counted, defaultdict)
+        assert dict(counted) == plain
+
+    def test_process_with_unhashable_gpu_entry(self, shared_processor):
+        """Test that non-string GPU entries are counted by their string form."""
+        processor = shared_processor
+        raw_data = {'action': 'train', 'network': 'resnet50', 'success': True, 'gpu': [{'name': 'A100'}]}
+
+        result = processor.process({}, raw_data)
+
+        assert result['total_action_train_pass'] == 1
+        assert result['gpu___name____a100___action_train'] == 1
+
 
 class TestMetricProcessorIntegration:
     """Integration tests for MetricProcessor."""
 
-    def test_full_processing_pipeline(self):
+    def test_full_processing_pipeline(self, shared_processor):
         """Test complete processing pipeline with real data."""
-        processor = MetricProcessor()
+        processor = shared_processor
         metrics = {}
 
         # Simulate multiple telemetry events
@@ -262,8 +338,7 @@ class TestMetricProcessorIntegration:
              'success': True, 'gpu': ['NVIDIA A100'], 'time_lapsed': 900},
         ]
 
-        for event in events:
-            metrics = processor.process(metrics, event)
+        metrics = processor.process_batch(metrics, events)
 
         # Verify metrics were accumulated
         assert metrics['total_action_train_pass'] == 1
@@ -272,6 +347,28 @@ class TestMetricProcessorIntegration:
         assert 'time_lapsed_today' in metrics
         assert metrics['time_lapsed_today'] == 6300  # Sum of all time_lapsed
 
+    def test_process_batch_matches_process(self, shared_processor):
+        """Test that process_batch gives the same metrics as per-event process calls."""
+        processor = shared_processor
+        now = datetime(2025, 1, 2, 12, 0, 0)
+        events = [
+            {'version': '5.3.0', 'network': 'resnet50', 'action': 'train',
+             'success': True, 'gpu': ['NVIDIA A100', 'NVIDIA A100'], 'time_lapsed': 3600},
+            {'version': '5.3.0', 'network': 'yolov4', 'action': 'evaluate',
+             'success': False, 'gpu': ['NVIDIA V100'], 'time_lapsed': 900},
+        ]
+
+        # Previous update was on an earlier day, so the daily total resets once
+        sequential = {'time_lapsed_today': 50, 'last_updated': '2025-01-01T23:00:00'}
+        for event in events:
+            processor.process(sequential, event, {'now': now})
+
+        batched = {'time_lapsed_today': 50, 'last_updated': '2025-01-01T23:00:00'}
+        processor.process_batch(batched, events, {'now': now})
+
+        assert batched == sequential
+        assert batched['time_lapsed_today'] == 4500
+
     def test_custom_builder_integration(self):
         """Test integration with a custom builder."""
         class CustomCounterBuilder(MetricBuilder):
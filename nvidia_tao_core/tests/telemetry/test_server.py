@@ -14,63 +14,121 @@
 
 """Unit tests for metrics API endpoint and utilities."""
 
-import json
+import base64
+import functools
+import orjson
 import pytest
 from datetime import datetime
 from unittest.mock import patch
 
+# Fixed 'last_updated' for stored metrics whose timestamp does not matter to the test
+_LAST_UPDATED_ISO = '2025-01-15T10:00:00'
+
+# Payload shared by most tests, encoded once at import
+_BASE_PAYLOAD = {
+    'version': '5.3.0',
+    'network': 'resnet50',
+    'action': 'train',
+    'success': True,
+    'gpu': ['NVIDIA A100']
+}
+_BASE_PAYLOAD_JSON = orjson.dumps(_BASE_PAYLOAD)
+
+_ACTIONS = ['train', 'evaluate', 'export', 'prune', 'inference']
+_NETWORKS = ['resnet50', 'yolov4', 'efficientnet', 'mask_rcnn']
+_ACTION_JSON = {
+    action: orjson.dumps({**_BASE_PAYLOAD, 'action': action}) for action in _ACTIONS
+}
+_NETWORK_JSON = {
+    network: orjson.dumps({**_BASE_PAYLOAD, 'network': network}) for network in _NETWORKS
+}
+
+_AUTH_HEADERS = {
+    'Authorization': 'Basic ' + base64.b64encode(b'$metricstoken:test_key').decode('utf-8')
+}
+_WRONG_AUTH_HEADERS = {
+    'Authorization': 'Basic ' + base64.b64encode(b'$metricstoken:wrong_key').decode('utf-8')
+}
+
+
+# Storage patchers are built once and started for the whole module
+_GET_METRICS_PATCHER = patch('nvidia_tao_core.microservices.blueprints.v1.admin.get_metrics')
+_SET_METRICS_PATCHER = patch('nvidia_tao_core.microservices.blueprints.v1.admin.set_metrics')
+
+
+def _post_metrics(client, payload_bytes, headers=_AUTH_HEADERS):
+    """POST an already encoded JSON payload to the metrics endpoint."""
+    return client.post(
+        '/api/v1/metrics',
+        data=payload_bytes,
+        content_type='application/json',
+        headers=headers
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_mongo():
+    """Mock MongoDB connections to prevent hanging (once for the whole module)."""
+    with patch('nvidia_tao_core.microservices.utils.stateless_handler_utils.MongoHandler'):
+        yield
+
+
+@pytest.fixture(scope="module")
+def storage_mocks():
+    """Patch get_metrics/set_metrics once for the module; tests reset the mocks instead."""
+    mock_get = _GET_METRICS_PATCHER.start()
+    mock_set = _SET_METRICS_PATCHER.start()
+    yield mock_get, mock_set
+    _SET_METRICS_PATCHER.stop()
+    _GET_METRICS_PATCHER.stop()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_app():
+    """Import and configure the Flask app once.
+
+    Callers must have the Mongo mock active, since importing the app sets up
+    the blueprints and their storage handlers.
+    """
+    # Import app here to avoid circular imports
+    from nvidia_tao_core.microservices.app import app
+    app.config['TESTING'] = True
+    return app
+
+
+@pytest.fixture(scope="module")
+def client(mock_mongo):
+    """Create Flask test client, shared by all tests in the module.
+
+    The tests only check responses and mock calls, so the client is not
+    entered as a context manager and no request context is kept around.
+    Use ``with`` in a test that needs to inspect ``session`` or ``g``.
+    """
+    return _get_app().test_client()
+
 
 class TestMetricsAPIEndpoint:
     """Test cases for /api/v1/metrics endpoint."""
 
     @pytest.fixture
-    def client(self):
-        """Create Flask test client."""
-        # Import app here to avoid circular imports
-        from nvidia_tao_core.microservices.app import app
-        app.config['TESTING'] = True
-        with app.test_client() as client:
-            yield client
-
-    @pytest.fixture(autouse=True)
-    def mock_mongo(self):
-        """Mock MongoDB connections to prevent hanging."""
-        with patch('nvidia_tao_core.microservices.utils.stateless_handler_utils.MongoHandler'):
-            yield
-
-    @pytest.fixture
-    def mock_metrics_storage(self):
-        """Mock metrics storage."""
-        with patch('nvidia_tao_core.microservices.blueprints.v1.admin.get_metrics') as mock_get:
-            with patch('nvidia_tao_core.microservices.blueprints.v1.admin.set_metrics') as mock_set:
-                mock_get.return_value = {
-                    'last_updated': datetime(2025, 1, 15, 10, 0).isoformat()
-                }
-                yield mock_get, mock_set
-
-    @pytest.fixture
-    def mock_auth(self):
-        """Mock authentication by patching os.getenv for INGRESSENABLED."""
-        # Patch os.getenv in the auth module to return "true" for INGRESSENABLED
-        # This is equivalent to the old: patch('nvidia_tao_core.microservices.app.ingress_enabled', True)
-        with patch('nvidia_tao_core.microservices.blueprints.v1.auth.os.getenv') as mock_getenv:
-            def getenv_side_effect(key, default=None):
-                if key == 'INGRESSENABLED':
-                    return 'true'
-                return default
-            mock_getenv.side_effect = getenv_side_effect
-            yield
+    def mock_metrics_storage(self, storage_mocks):
+        """Mock metrics storage with fresh stored metrics for each test."""
+        mock_get, mock_set = storage_mocks
+        mock_get.reset_mock()
+        mock_set.reset_mock()
+        mock_get.return_value = {
+            'last_updated': _LAST_UPDATED_ISO
+        }
+        return mock_get, mock_set
 
     @pytest.fixture
-    def auth_headers(self):
-        """Get authentication headers for metrics endpoint."""
-        import base64
-        credentials = base64.b64encode(b'$metricstoken:test_key').decode('utf-8')
-        return {
-            'Authorization': f'Basic {credentials}'
-        }
+    def mock_auth(self, monkeypatch):
+        """Mock authentication by enabling ingress through the environment."""
+        # The auth module reads INGRESSENABLED with os.getenv on every request, so
+        # setting the variable is equivalent to patching os.getenv there
+        monkeypatch.setenv('INGRESSENABLED', 'true')
 
-    def test_metrics_endpoint_successful_request(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_successful_request(self, client, mock_metrics_storage, mock_auth):
         """Test successful metrics submission."""
         _, mock_set = mock_metrics_storage
 
@@ -84,38 +142,20 @@ class TestMetricsAPIEndpoint:
             'user_error': False
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 201
         mock_set.assert_called_once()
 
-    def test_metrics_endpoint_with_minimal_data(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_with_minimal_data(self, client, mock_metrics_storage, mock_auth):
         """Test metrics submission with minimal required data."""
         _ = mock_metrics_storage
 
-        payload = {
-            'version': '5.3.0',
-            'network': 'resnet50',
-            'action': 'train',
-            'success': True,
-            'gpu': ['NVIDIA A100']
-        }
-
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, _BASE_PAYLOAD_JSON)
 
         assert response.status_code == 201
 
-    def test_metrics_endpoint_failed_action(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_failed_action(self, client, mock_metrics_storage, mock_auth):
         """Test metrics submission for failed action."""
         _, mock_set = mock_metrics_storage
 
@@ -128,95 +168,61 @@ class TestMetricsAPIEndpoint:
             'user_error': True
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 201
 
         # Verify that set_metrics was called with updated metrics
-        call_args = mock_set.call_args[0][0]
-        assert 'total_action_export_fail' in call_args
-        assert call_args['total_action_export_fail'] == 1
+        submitted = mock_set.call_args.args[0]
+        assert 'total_action_export_fail' in submitted
+        assert submitted['total_action_export_fail'] == 1
 
-    def test_metrics_endpoint_multiple_submissions(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_multiple_submissions(self, client, mock_metrics_storage, mock_auth):
         """Test multiple metrics submissions increment counters."""
         mock_get, mock_set = mock_metrics_storage
 
         # Set initial state
         mock_get.return_value = {
-            'last_updated': datetime(2025, 1, 15, 10, 0).isoformat(),
+            'last_updated': _LAST_UPDATED_ISO,
             'total_action_train_pass': 5
         }
 
-        payload = {
-            'version': '5.3.0',
-            'network': 'resnet50',
-            'action': 'train',
-            'success': True,
-            'gpu': ['NVIDIA A100']
-        }
-
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, _BASE_PAYLOAD_JSON)
 
         assert response.status_code == 201
 
         # Verify counter was incremented
-        call_args = mock_set.call_args[0][0]
-        assert call_args['total_action_train_pass'] == 6
+        submitted = mock_set.call_args.args[0]
+        assert submitted['total_action_train_pass'] == 6
 
-    def test_metrics_endpoint_invalid_data(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_invalid_data(self, client, mock_auth):
         """Test metrics submission with invalid data."""
-        _ = mock_metrics_storage
         payload = {
             'invalid_field': 'value'
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 400
 
-    def test_metrics_endpoint_empty_payload(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_empty_payload(self, client, mock_metrics_storage, mock_auth):
         """Test metrics submission with empty payload."""
         _ = mock_metrics_storage
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps({}),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps({}))
 
         assert response.status_code == 201
 
-    def test_metrics_endpoint_malformed_json(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_malformed_json(self, client, mock_auth):
         """Test metrics submission with malformed JSON."""
-        _ = mock_metrics_storage
-        response = client.post(
-            '/api/v1/metrics',
-            data='invalid json{',
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, 'invalid json{')
 
         assert response.status_code == 400
 
-    def test_metrics_endpoint_time_lapsed_accumulation(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_time_lapsed_accumulation(self, client, mock_metrics_storage, mock_auth):
         """Test that time_lapsed accumulates correctly on same day."""
         mock_get, mock_set = mock_metrics_storage
 
+        # Time only accumulates within the current day, so this one needs the real clock
         mock_get.return_value = {
             'last_updated': datetime.now().isoformat(),
             'time_lapsed_today': 100
@@ -231,20 +237,15 @@ class TestMetricsAPIEndpoint:
             'time_lapsed': 50
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 201
 
         # Verify time accumulated
-        call_args = mock_set.call_args[0][0]
-        assert call_args['time_lapsed_today'] == 150
+        submitted = mock_set.call_args.args[0]
+        assert submitted['time_lapsed_today'] == 150
 
-    def test_metrics_endpoint_comprehensive_metric_created(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_comprehensive_metric_created(self, client, mock_metrics_storage, mock_auth):
         """Test that comprehensive metric name is created correctly."""
         _, mock_set = mock_metrics_storage
 
@@ -257,20 +258,15 @@ class TestMetricsAPIEndpoint:
             'user_error': False
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 201
 
         # Verify comprehensive metric was created
-        call_args = mock_set.call_args[0][0]
+        submitted = mock_set.call_args.args[0]
 
         # Find the comprehensive metric (long key with all attributes)
-        comprehensive_keys = [k for k in call_args.keys() if k.startswith('network_efficientnet_action_evaluate')]
+        comprehensive_keys = [k for k in submitted.keys() if k.startswith('network_efficientnet_action_evaluate')]
 
         comprehensive_key = max(comprehensive_keys, key=len)
 
@@ -279,7 +275,7 @@ class TestMetricsAPIEndpoint:
         assert 'version_6_0_0' in comprehensive_key
         assert 'status_pass' in comprehensive_key
 
-    def test_metrics_endpoint_with_special_characters(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_with_special_characters(self, client, mock_metrics_storage, mock_auth):
         """Test metrics submission with special characters in fields."""
         _, mock_set = mock_metrics_storage
 
@@ -291,101 +287,46 @@ class TestMetricsAPIEndpoint:
             'gpu': ['NVIDIA-A100-80GB']
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 201
 
         # Verify special characters were sanitized
-        call_args = mock_set.call_args[0][0]
+        submitted = mock_set.call_args.args[0]
 
         # Check that sanitized versions exist in keys
-        assert any('custom_net_v2' in k for k in call_args.keys())
-        assert any('fine_tune' in k for k in call_args.keys())
+        assert any('custom_net_v2' in k for k in submitted.keys())
+        assert any('fine_tune' in k for k in submitted.keys())
 
-    def test_metrics_endpoint_last_updated_timestamp(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_last_updated_timestamp(self, client, mock_metrics_storage, mock_auth):
         """Test that last_updated timestamp is set correctly."""
         _, mock_set = mock_metrics_storage
 
-        payload = {
-            'version': '5.3.0',
-            'network': 'resnet50',
-            'action': 'train',
-            'success': True,
-            'gpu': ['NVIDIA A100']
-        }
-
         before_time = datetime.now()
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, _BASE_PAYLOAD_JSON)
 
         after_time = datetime.now()
 
         assert response.status_code == 201
 
         # Verify timestamp was updated
-        call_args = mock_set.call_args[0][0]
-        timestamp = datetime.fromisoformat(call_args['last_updated'])
+        submitted = mock_set.call_args.args[0]
+        timestamp = datetime.fromisoformat(submitted['last_updated'])
 
         assert before_time <= timestamp <= after_time
 
-    def test_metrics_endpoint_without_auth(self, client, mock_metrics_storage):
-        """Test metrics submission without authentication - succeeds as metrics endpoint is open."""
-        _ = mock_metrics_storage
-
-        payload = {
-            'version': '5.3.0',
-            'network': 'resnet50',
-            'action': 'train',
-            'success': True,
-            'gpu': ['NVIDIA A100']
-        }
-
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-
-        # Metrics endpoint is in admin blueprint which doesn't have auth requirement
-        assert response.status_code == 201
-
-    def test_metrics_endpoint_with_wrong_auth(self, client, mock_metrics_storage):
-        """Test metrics submission with auth headers - succeeds as metrics endpoint is open."""
+    @pytest.mark.parametrize('headers', [None, _WRONG_AUTH_HEADERS], ids=['no_auth', 'wrong_auth'])
+    def test_metrics_endpoint_open_without_valid_auth(self, client, mock_metrics_storage, headers):
+        """Test metrics submission without valid auth - succeeds as metrics endpoint is open."""
         _ = mock_metrics_storage
 
-        import base64
-        credentials = base64.b64encode(b'$metricstoken:wrong_key').decode('utf-8')
-        headers = {'Authorization': f'Basic {credentials}'}
-
-        payload = {
-            'version': '5.3.0',
-            'network': 'resnet50',
-            'action': 'train',
-            'success': True,
-            'gpu': ['NVIDIA A100']
-        }
-
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=headers
-        )
+        response = _post_metrics(client, _BASE_PAYLOAD_JSON, headers=headers or {})
 
         # Metrics endpoint is in admin blueprint which doesn't have auth requirement
         assert response.status_code == 201
 
-    def test_metrics_endpoint_user_error_true(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_user_error_true(self, client, mock_metrics_storage, mock_auth):
         """Test metrics submission with user_error=True."""
         _, mock_set = mock_metrics_storage
 
@@ -398,21 +339,16 @@ class TestMetricsAPIEndpoint:
             'user_error': True
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 201
 
         # Verify comprehensive metric was created
-        call_args = mock_set.call_args[0][0]
-        comprehensive_keys = [k for k in call_args.keys() if 'status_fail' in k]
+        submitted = mock_set.call_args.args[0]
+        comprehensive_keys = [k for k in submitted.keys() if 'status_fail' in k]
         assert len(comprehensive_keys) > 0
 
-    def test_metrics_endpoint_user_error_false(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_user_error_false(self, client, mock_metrics_storage, mock_auth):
         """Test metrics submission with user_error=False."""
         _, mock_set = mock_metrics_storage
 
@@ -425,47 +361,29 @@ class TestMetricsAPIEndpoint:
             'user_error': False
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 201
 
         # Verify comprehensive metric was created
-        call_args = mock_set.call_args[0][0]
-        comprehensive_keys = [k for k in call_args.keys() if 'status_pass' in k]
+        submitted = mock_set.call_args.args[0]
+        comprehensive_keys = [k for k in submitted.keys() if 'status_pass' in k]
         assert len(comprehensive_keys) > 0
 
-    def test_metrics_endpoint_without_user_error_field(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_without_user_error_field(self, client, mock_metrics_storage, mock_auth):
         """Test metrics submission without user_error field (should default to False)."""
         _, mock_set = mock_metrics_storage
 
-        payload = {
-            'version': '5.3.0',
-            'network': 'resnet50',
-            'action': 'train',
-            'success': True,
-            'gpu': ['NVIDIA A100']
-        }
-
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, _BASE_PAYLOAD_JSON)
 
         assert response.status_code == 201
 
         # Verify comprehensive metric was created
-        call_args = mock_set.call_args[0][0]
-        comprehensive_keys = [k for k in call_args.keys() if 'status_pass' in k]
+        submitted = mock_set.call_args.args[0]
+        comprehensive_keys = [k for k in submitted.keys() if 'status_pass' in k]
         assert len(comprehensive_keys) > 0
 
-    def test_metrics_endpoint_multiple_gpu_types(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    def test_metrics_endpoint_multiple_gpu_types(self, client, mock_metrics_storage, mock_auth):
         """Test metrics submission with multiple different GPU types."""
         _, mock_set = mock_metrics_storage
 
@@ -477,24 +395,18 @@ class TestMetricsAPIEndpoint:
             'gpu': ['NVIDIA A100', 'NVIDIA V100', 'NVIDIA H100', 'NVIDIA A100']
         }
 
-        response = client.post(
-            '/api/v1/metrics',
-            data=json.dumps(payload),
-            content_type='application/json',
-            headers=auth_headers
-        )
+        response = _post_metrics(client, orjson.dumps(payload))
 
         assert response.status_code == 201
 
         # Verify GPU counters were updated for each type
-        call_args = mock_set.call_args[0][0]
-        assert call_args['gpu_nvidia_a100_action_train'] == 2
-        assert call_args['gpu_nvidia_v100_action_train'] == 1
-        assert call_args['gpu_nvidia_h100_action_train'] == 1
+        submitted = mock_set.call_args.args[0]
+        assert submitted['gpu_nvidia_a100_action_train'] == 2
+        assert submitted['gpu_nvidia_v100_action_train'] == 1
+        assert submitted['gpu_nvidia_h100_action_train'] == 1
 
         # Verify comprehensive metric includes all GPU types with counts
-        call_args = mock_set.call_args[0][0]
-        comprehensive_keys = [k for k in call_args.keys() if k.startswith('network_resnet50_action_train')]
+        comprehensive_keys = [k for k in submitted.keys() if k.startswith('network_resnet50_action_train')]
         assert comprehensive_keys, "No comprehensive metric keys found"
         comp_key = max(comprehensive_keys, key=len)
         assert "gpu_4_" in comp_key
@@ -502,62 +414,28 @@ class TestMetricsAPIEndpoint:
         assert "NVIDIA_V100_1" in comp_key
         assert "NVIDIA_H100_1" in comp_key
 
-    def test_metrics_endpoint_different_actions(self, client, mock_metrics_storage, mock_auth, auth_headers):
+    @pytest.mark.parametrize('action', _ACTIONS)
+    def test_metrics_endpoint_different_actions(self, client, mock_metrics_storage, mock_auth, action):
         """Test metrics submission for different actions."""
         _, mock_set = mock_metrics_storage
 
-        actions = ['train', 'evaluate', 'export', 'prune', 'inference']
-
-        for action in actions:
-            payload = {
-                'version': '5.3.0',
-                'network': 'resnet50',
-                'action': action,
-                'success': True,
-                'gpu': ['NVIDIA A100']
-            }
-
-            response = client.post(
-                '/api/v1/metrics',
-                data=json.dumps(payload),
-                content_type='application/json',
-                headers=auth_headers
-            )
-
-            assert response.status_code == 201
-
-        # Verify all actions were recorded
-        call_args = mock_set.call_args[0][0]
-        for action in actions:
-            assert f'total_action_{action}_pass' in call_args
-            assert call_args[f'total_action_{action}_pass'] == 1
-
-    def test_metrics_endpoint_different_networks(self, client, mock_metrics_storage, mock_auth, auth_headers):
+        response = _post_metrics(client, _ACTION_JSON[action])
+
+        assert response.status_code == 201
+
+        # Verify the action was recorded by the single set_metrics call of this POST
+        (submitted,) = [call.args[0] for call in mock_set.call_args_list]
+        assert submitted[f'total_action_{action}_pass'] == 1
+
+    @pytest.mark.parametrize('network', _NETWORKS)
+    def test_metrics_endpoint_different_networks(self, client, mock_metrics_storage, mock_auth, network):
         """Test metrics submission for different networks."""
         _, mock_set = mock_metrics_storage
 
-        networks = ['resnet50', 'yolov4', 'efficientnet', 'mask_rcnn']
-
-        for network in networks:
-            payload = {
-                'version': '5.3.0',
-                'network': network,
-                'action': 'train',
-                'success': True,
-                'gpu': ['NVIDIA A100']
-            }
-
-            response = client.post(
-                '/api/v1/metrics',
-                data=json.dumps(payload),
-                content_type='application/json',
-                headers=auth_headers
-            )
-
-            assert response.status_code == 201
-
-        # Verify all networks were recorded
-        call_args = mock_set.call_args[0][0]
-        for network in networks:
-            assert f'network_{network}_action_train' in call_args
-            assert call_args[f'network_{network}_action_train'] == 1
+        response = _post_metrics(client, _NETWORK_JSON[network])
+
+        assert response.status_code == 201
+
+        # Verify the network was recorded by the single set_metrics call of this POST
+        (submitted,) = [call.args[0] for call in mock_set.call_args_list]
+        assert submitted[f'network_{network}_action_train'] == 1
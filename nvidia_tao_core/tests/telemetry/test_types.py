@@ -14,81 +14,97 @@
 
 """Unit tests for telemetry types module."""
 
+import pytest
+
 from nvidia_tao_core.telemetry.types import AttributeType, MetricAttribute, TelemetryData
 
 
 class TestAttributeType:
     """Test cases for AttributeType enum."""
 
-    def test_attribute_types_exist(self):
+    @pytest.mark.parametrize('attr_type, value', [
+        (AttributeType.STRING, "string"),
+        (AttributeType.BOOLEAN, "boolean"),
+        (AttributeType.INTEGER, "integer"),
+        (AttributeType.LIST, "list"),
+    ])
+    def test_attribute_types_exist(self, attr_type, value):
         """Test that all expected attribute types exist."""
-        assert AttributeType.STRING.value == "string"
-        assert AttributeType.BOOLEAN.value == "boolean"
-        assert AttributeType.INTEGER.value == "integer"
-        assert AttributeType.LIST.value == "list"
+        assert attr_type.value == value
 
-    def test_attribute_type_values(self):
+    @pytest.mark.parametrize('attr_type', list(AttributeType))
+    def test_attribute_type_values(self, attr_type):
         """Test that attribute type values are strings."""
-        for attr_type in AttributeType:
-            assert isinstance(attr_type.value, str)
+        assert isinstance(attr_type.value, str)
 
 
-class TestMetricAttribute:
-    """Test cases for MetricAttribute dataclass."""
+@pytest.fixture(scope="class")
+def canonical_attrs():
+    """Build one MetricAttribute per attribute type, shared per test class.
 
-    def test_metric_attribute_creation(self):
-        """Test creating a MetricAttribute with all required fields."""
-        attr = MetricAttribute(
+    Tests only read these instances, so they are constructed once per class.
+    """
+    return {
+        'string_attr': MetricAttribute(
             name='test_attr',
             raw_key='test',
             attr_type=AttributeType.STRING,
             default='default_value'
-        )
-
-        assert attr.name == 'test_attr'
-        assert attr.raw_key == 'test'
-        assert attr.attr_type == AttributeType.STRING
-        assert attr.default == 'default_value'
-        assert attr.include_in_comprehensive is True  # Default
-        assert attr.metric_order == 100  # Default
-
-    def test_metric_attribute_with_custom_fields(self):
-        """Test creating a MetricAttribute with custom optional fields."""
-        attr = MetricAttribute(
+        ),
+        'bool_attr': MetricAttribute(
             name='custom',
             raw_key='custom_key',
             attr_type=AttributeType.BOOLEAN,
             default=False,
             include_in_comprehensive=False,
             metric_order=5
-        )
-
-        assert attr.include_in_comprehensive is False
-        assert attr.metric_order == 5
-
-    def test_metric_attribute_integer_type(self):
-        """Test MetricAttribute with INTEGER type."""
-        attr = MetricAttribute(
+        ),
+        'int_attr': MetricAttribute(
             name='count',
             raw_key='count',
             attr_type=AttributeType.INTEGER,
             default=0
-        )
-
-        assert attr.attr_type == AttributeType.INTEGER
-        assert attr.default == 0
-
-    def test_metric_attribute_list_type(self):
-        """Test MetricAttribute with LIST type."""
-        attr = MetricAttribute(
+        ),
+        'list_attr': MetricAttribute(
             name='items',
             raw_key='items',
             attr_type=AttributeType.LIST,
             default=[]
-        )
+        ),
+    }
+
+
+class TestMetricAttribute:
+    """Test cases for MetricAttribute dataclass."""
+
+    def test_metric_attribute_creation(self, canonical_attrs):
+        """Test creating a MetricAttribute with all required fields."""
+        attr = canonical_attrs['string_attr']
+
+        assert attr.name == 'test_attr'
+        assert attr.raw_key == 'test'
+        assert attr.attr_type == AttributeType.STRING
+        assert attr.default == 'default_value'
+        assert attr.include_in_comprehensive is True  # Default
+        assert attr.metric_order == 100  # Default
+
+    def test_metric_attribute_with_custom_fields(self, canonical_attrs):
+        """Test creating a MetricAttribute with custom optional fields."""
+        attr = canonical_attrs['bool_attr']
+
+        assert attr.include_in_comprehensive is False
+        assert attr.metric_order == 5
+
+    @pytest.mark.parametrize('key, attr_type, default', [
+        ('int_attr', AttributeType.INTEGER, 0),
+        ('list_attr', AttributeType.LIST, []),
+    ])
+    def test_metric_attribute_typed_default(self, canonical_attrs, key, attr_type, default):
+        """Test MetricAttribute with INTEGER and LIST types."""
+        attr = canonical_attrs[key]
 
-        assert attr.attr_type == AttributeType.LIST
-        assert attr.default == []
+        assert attr.attr_type == attr_type
+        assert attr.default == default
 
 
 class TestTelemetryData:
@@ -54,6 +54,11 @@ class TestSanitizeFieldValue:
         """Test sanitizing empty string."""
         assert sanitize_field_value("") == ""
 
+    def test_sanitize_non_ascii_characters(self):
+        """Test that non-ASCII characters are replaced like other special characters."""
+        assert sanitize_field_value("café-net") == "caf__net"
+        assert sanitize_field_value("Ünet", uppercase=True) == "_NET"
+
     def test_sanitize_numeric_values(self):
         """Test sanitizing numeric values."""
         assert sanitize_field_value(123) == "123"
@@ -113,6 +118,12 @@ class TestCreateGpuIdentifier:
         assert "3_A100_2" in result
         assert "V100_1" in result
 
+    def test_unhashable_gpu_entry(self):
+        """Test that non-string GPU entries are counted by their string form."""
+        result = create_gpu_identifier([["A100"], ["A100"]])
+        assert result.startswith("2_")
+        assert result.endswith("_2")
+
 
 class TestExtractTelemetryData:
     """Test cases for extract_telemetry_data function."""
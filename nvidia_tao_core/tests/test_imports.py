@@ -17,9 +17,14 @@ Usage:
 import sys
 import os
 import ast
+import functools
 import importlib.util
+import json
+import multiprocessing
+import re
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import pytest
 
 # Set environment variables needed for imports (mock values for local testing)
@@ -33,26 +38,64 @@ os.environ.setdefault('MONGO_USERNAME', 'test_user')
 os.environ.setdefault('MONGO_PASSWORD', 'test_password')
 
 # Suppress MongoDB connection attempts during import
-# We need to patch pymongo BEFORE any imports happen
-import unittest.mock  # noqa: E402
-
-# Create a proper mock for pymongo and all its submodules
-pymongo_mock = unittest.mock.MagicMock()
-pymongo_mock.MongoClient = unittest.mock.MagicMock()
-pymongo_mock.errors = unittest.mock.MagicMock()
-
-# Patch all pymongo modules
-sys.modules['pymongo'] = pymongo_mock
-sys.modules['pymongo.errors'] = pymongo_mock.errors
-sys.modules['pymongo.synchronous'] = unittest.mock.MagicMock()
-sys.modules['pymongo.synchronous.mongo_client'] = unittest.mock.MagicMock()
-sys.modules['pymongo.client_options'] = unittest.mock.MagicMock()
-sys.modules['pymongo.auth_shared'] = unittest.mock.MagicMock()
+# We need to stub pymongo BEFORE any imports happen. Plain modules are enough
+# here: nothing is executed against them, they only have to satisfy imports.
+import types  # noqa: E402
+
+
+def _stub_module(name, **attrs):
+    """Register an empty module under name in sys.modules with the given attributes"""
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+def _stub_class(name, base=object):
+    """Create an empty placeholder class"""
+    return type(name, (base,), {})
+
+
+# Stub pymongo and the names the project imports from it
+pymongo_stub = _stub_module(
+    'pymongo',
+    MongoClient=_stub_class('MongoClient'),
+    ReturnDocument=_stub_class('ReturnDocument'),
+    ASCENDING=1,
+    DESCENDING=-1,
+    TEXT='text',
+)
+pymongo_stub.errors = _stub_module(
+    'pymongo.errors',
+    PyMongoError=_stub_class('PyMongoError', Exception),
+    WriteError=_stub_class('WriteError', Exception),
+    AutoReconnect=_stub_class('AutoReconnect', Exception),
+)
+pymongo_stub.synchronous = _stub_module('pymongo.synchronous')
+pymongo_stub.synchronous.mongo_client = _stub_module('pymongo.synchronous.mongo_client')
+pymongo_stub.client_options = _stub_module('pymongo.client_options')
+pymongo_stub.auth_shared = _stub_module('pymongo.auth_shared')
 
 # Root directory to scan - go up to the repository root
 # From nvidia_tao_core/tests/test_imports.py -> tao-core/
 ROOT_DIR = Path(__file__).parent.parent.parent
 
+# Parsed imports keyed by file path, reused while the file's mtime and size are unchanged
+IMPORTS_CACHE_FILE = ROOT_DIR / '.pytest_cache' / 'imports_cache.json'
+
+# Optional public package dependencies (external packages not required for core functionality)
+OPTIONAL_DEPS = [
+    'hydra', 'clearml', 'wandb',
+    'pytorch_lightning', 'tensorflow', 'mpi4py',
+    'pycuda', 'pycuda.driver', 'torch',
+    'diffusers', 'imageio', 'release', 'transformers'
+]
+# Matches a module name containing any optional dependency, in a single search
+OPTIONAL_DEPS_RE = re.compile('|'.join(re.escape(dep) for dep in OPTIONAL_DEPS))
+
+# Top-level standard library modules, which need no find_spec lookup (Python 3.10+)
+STDLIB_MODULE_NAMES = getattr(sys, 'stdlib_module_names', frozenset())
+
 # Track results
 files_with_import_errors = []
 files_without_errors = []
@@ -72,45 +115,100 @@ def find_python_files(root_dir):
         'test_airgapped_loader.py',
     }
 
-    for path in Path(root_dir).rglob('*.py'):
-        # Skip excluded directories
-        if any(excluded in path.parts for excluded in exclude_dirs):
-            continue
-        # Skip excluded files
-        if path.name in exclude_files:
-            continue
-        python_files.append(path)
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        # Prune excluded directories in place so os.walk never descends into them
+        dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
+        python_files.extend(
+            Path(dirpath) / name for name in filenames
+            if name.endswith('.py') and name not in exclude_files
+        )
 
     return sorted(python_files)
 
 
-def _get_try_except_line_ranges(tree):
-    """Return a set of line numbers that fall inside try/except blocks.
+def _get_try_except_line_ranges(try_nodes):
+    """Return a set of line numbers that fall inside the given try/except blocks.
 
     Imports guarded by try/except are intentionally optional and should not
     be flagged as errors when the module is missing.
     """
     guarded_lines = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Try):
-            for child in node.body:
-                for sub in ast.walk(child):
-                    if hasattr(sub, 'lineno'):
-                        guarded_lines.add(sub.lineno)
+    for node in try_nodes:
+        for child in node.body:
+            for sub in ast.walk(child):
+                if hasattr(sub, 'lineno'):
+                    guarded_lines.add(sub.lineno)
     return guarded_lines
 
 
-def get_all_imports_in_file(file_path):
-    """Extract all import statements from a Python file using AST"""
+def load_imports_cache():
+    """Load the parsed imports cache, or an empty cache if it is missing or unreadable"""
+    try:
+        with open(IMPORTS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_imports_cache(cache):
+    """Write the parsed imports cache, ignoring failures (the cache is only an optimization)"""
+    try:
+        IMPORTS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(IMPORTS_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def get_all_imports_in_file(file_path, cache=None):
+    """Extract all import statements from a Python file using AST
+
+    When a cache dict is given, files whose mtime and size match the cached
+    entry are not read or parsed again, and fresh results are stored in it.
+    """
+    if cache is None:
+        return _parse_imports_in_file(file_path)
+
+    try:
+        stat = file_path.stat()
+    except OSError as e:
+        return [], f"Error analyzing file: {e}"
+    key = str(file_path)
+    entry = cache.get(key)
+    if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        return entry['imports'], entry['error']
+
+    imports_list, parse_error = _parse_imports_in_file(file_path)
+    cache[key] = {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'imports': imports_list,
+        'error': parse_error
+    }
+    return imports_list, parse_error
+
+
+def _parse_imports_in_file(file_path):
+    """Read and parse a Python file, returning its unguarded imports and any parse error"""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
         tree = ast.parse(content, filename=str(file_path))
         imports_list = []
-        guarded_lines = _get_try_except_line_ranges(tree)
 
+        # Collect imports and try blocks in a single pass over the tree
+        import_nodes = []
+        try_nodes = []
         for node in ast.walk(tree):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                import_nodes.append(node)
+            elif isinstance(node, ast.Try):
+                try_nodes.append(node)
+        guarded_lines = _get_try_except_line_ranges(try_nodes)
+
+        for node in import_nodes:
             if isinstance(node, ast.Import):
                 if node.lineno in guarded_lines:
                     continue
@@ -149,6 +247,38 @@ def get_all_imports_in_file(file_path):
         return [], f"Error analyzing file: {e}"
 
 
+@functools.lru_cache(maxsize=4096)
+def _find_spec(module_name):
+    """importlib.util.find_spec memoized per process
+
+    The same modules are looked up from many files; each uncached lookup walks
+    sys.path. Exceptions are not cached, so callers see them on every call.
+    """
+    return importlib.util.find_spec(module_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _local_modules_in_dir(directory):
+    """Return (package names, .py file stems) found directly in a directory
+
+    Each directory is scanned once per process, replacing the per-import
+    exists()/is_dir() probes with set lookups.
+    """
+    packages = set()
+    modules = set()
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return frozenset(), frozenset()
+    for entry in entries:
+        if entry.is_dir():
+            if os.path.exists(os.path.join(entry.path, '__init__.py')):
+                packages.add(entry.name)
+        elif entry.name.endswith('.py'):
+            modules.add(entry.name[:-3])
+    return frozenset(packages), frozenset(modules)
+
+
 def is_local_package_import(file_path, module_name):
     """Check if an import is from a local package (sibling/parent/ancestor directory)"""
     if not module_name or module_name.startswith('.'):
@@ -157,38 +287,25 @@ def is_local_package_import(file_path, module_name):
     # Get the directory containing the file
     file_dir = file_path.parent
 
-    # Check if module exists as a sibling directory or file
-    potential_module_dir = file_dir / module_name
-    potential_module_file = file_dir / f"{module_name}.py"
-
-    if potential_module_dir.exists() and potential_module_dir.is_dir():
-        # Check if it's a package (has __init__.py)
-        if (potential_module_dir / "__init__.py").exists():
-            return True
-
-    if potential_module_file.exists():
+    # Check if module exists as a sibling package or file
+    packages, modules = _local_modules_in_dir(file_dir)
+    if module_name in packages or module_name in modules:
         return True
 
     # Check parent directory (for imports like 'utils' from handlers subdirectory)
-    parent_dir = file_dir.parent
-    potential_parent_module = parent_dir / module_name
-    if potential_parent_module.exists() and potential_parent_module.is_dir():
-        if (potential_parent_module / "__init__.py").exists():
-            return True
+    if module_name in _local_modules_in_dir(file_dir.parent)[0]:
+        return True
 
     # Check grandparent directory (for imports like 'blueprints' from microservices subdirectories)
-    grandparent_dir = parent_dir.parent
-    potential_grandparent_module = grandparent_dir / module_name
-    if potential_grandparent_module.exists() and potential_grandparent_module.is_dir():
-        if (potential_grandparent_module / "__init__.py").exists():
-            return True
+    if module_name in _local_modules_in_dir(file_dir.parent.parent)[0]:
+        return True
 
     # Handle special cases for package-relative imports within nvidia_tao_core
     # e.g., "from nvidia_tao_core.microservices.job_utils import X"
     if 'nvidia_tao_core' in module_name:
         # This is an absolute import within the project - check if it resolves
         try:
-            spec = importlib.util.find_spec(module_name)
+            spec = _find_spec(module_name)
             if spec is not None:
                 return True
         except Exception:
@@ -211,21 +328,17 @@ def check_imports_exist(file_path, imports_list):
     """
     errors = []
 
-    # Optional public package dependencies (external packages not required for core functionality)
-    optional_deps = [
-        'hydra', 'clearml', 'wandb',
-        'pytorch_lightning', 'tensorflow', 'mpi4py',
-        'pycuda', 'pycuda.driver', 'torch',
-        'diffusers', 'imageio', 'release', 'transformers'
-    ]
-
     for imp in imports_list:
         if imp['type'] == 'import':
             # Simple import - check if module exists
             module_name = imp['module']
 
             # Skip optional dependencies
-            if any(dep in module_name for dep in optional_deps):
+            if OPTIONAL_DEPS_RE.search(module_name):
+                continue
+
+            # Standard library modules always exist
+            if module_name.split('.')[0] in STDLIB_MODULE_NAMES:
                 continue
 
             # Check if it's a local package import
@@ -234,7 +347,7 @@ def check_imports_exist(file_path, imports_list):
 
             try:
                 # Just check if module can be found, don't execute
-                spec = importlib.util.find_spec(module_name.split('.')[0])
+                spec = _find_spec(module_name.split('.')[0])
                 if spec is None:
                     errors.append({
                         'line': imp['line'],
@@ -257,20 +370,24 @@ def check_imports_exist(file_path, imports_list):
                 continue
 
             # Skip optional dependencies
-            if any(dep in module_name for dep in optional_deps):
+            if OPTIONAL_DEPS_RE.search(module_name):
                 continue
 
             # Skip if module_name is None (can happen with certain import patterns)
             if not module_name:
                 continue
 
+            # Top-level standard library modules always exist
+            if module_name in STDLIB_MODULE_NAMES:
+                continue
+
             # Check if it's a local package import (like 'from utils import X')
             if is_local_package_import(file_path, module_name):
                 continue
 
             try:
                 # Try to find the module spec without executing
-                spec = importlib.util.find_spec(module_name)
+                spec = _find_spec(module_name)
                 if spec is None:
                     # Module doesn't exist
                     errors.append({
@@ -296,6 +413,20 @@ def check_imports_exist(file_path, imports_list):
     return errors
 
 
+def _analyze_one(file_path, cache_entry=None):
+    """Parse one file and check its imports (runs in a worker process)
+
+    Returns:
+        Tuple of (imports_list, parse_error, import_errors, cache_entry), where
+        cache_entry is the up-to-date imports cache entry for the file, or None
+        if the file could not be stat'ed
+    """
+    cache = {str(file_path): cache_entry} if cache_entry else {}
+    imports_list, parse_error = get_all_imports_in_file(file_path, cache)
+    import_errors = [] if parse_error else check_imports_exist(file_path, imports_list)
+    return imports_list, parse_error, import_errors, cache.get(str(file_path))
+
+
 def scan_and_test_files():
     """Scan all Python files and test imports (fast - no execution)"""
     print("=" * 100)
@@ -309,37 +440,43 @@ def scan_and_test_files():
     files_with_errors = []
     files_ok = []
     error_count = 0
-
-    for idx, file_path in enumerate(python_files, 1):
+    # Error report lines, written in one go after the scan instead of a print per line
+    report_lines = []
+    imports_cache = load_imports_cache()
+
+    # Files are independent, so parse and check them in parallel; results come back in file order
+    cache_entries = [imports_cache.get(str(file_path)) for file_path in python_files]
+    # Fork so workers inherit the pymongo stubs and this module as already imported
+    # (it may not be importable by name under --import-mode=importlib)
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context('fork')) as executor:
+        results = list(executor.map(_analyze_one, python_files, cache_entries, chunksize=32))
+
+    for file_path, (imports_list, parse_error, import_errors, cache_entry) in zip(python_files, results):
         relative_path = file_path.relative_to(ROOT_DIR)
-
-        # Get all imports from the file (fast - just AST parsing)
-        imports_list, parse_error = get_all_imports_in_file(file_path)
+        if cache_entry is not None:
+            imports_cache[str(file_path)] = cache_entry
 
         if parse_error:
             # Syntax error in the file
             error_count += 1
-            print(f"❌ [{error_count}] {relative_path}")
-            print(f"   Syntax Error: {parse_error}")
+            report_lines.append(f"❌ [{error_count}] {relative_path}")
+            report_lines.append(f"   Syntax Error: {parse_error}")
             files_with_errors.append({
                 'path': relative_path,
                 'error_type': 'SyntaxError',
                 'error_msg': parse_error,
                 'imports': []
             })
-            print()
+            report_lines.append("")
             continue
 
-        # Check if imported modules exist (without executing them)
-        import_errors = check_imports_exist(file_path, imports_list)
-
         if import_errors:
             error_count += 1
-            print(f"❌ [{error_count}] {relative_path}")
+            report_lines.append(f"❌ [{error_count}] {relative_path}")
             for err in import_errors:
-                print(f"   Line {err['line']}: {err['message']}")
+                report_lines.append(f"   Line {err['line']}: {err['message']}")
                 if 'importing' in err:
-                    print(f"      Trying to import: {', '.join(err['importing'])}")
+                    report_lines.append(f"      Trying to import: {', '.join(err['importing'])}")
 
             files_with_errors.append({
                 'path': relative_path,
@@ -348,10 +485,15 @@ def scan_and_test_files():
                 'imports': imports_list,
                 'errors': import_errors
             })
-            print()
+            report_lines.append("")
         else:
             files_ok.append(str(relative_path))
 
+    save_imports_cache(imports_cache)
+
+    if report_lines:
+        print("\n".join(report_lines))
+
     print(f"\nProcessed {len(python_files)} files:")
     print(f"  ✓ {len(files_ok)} files have valid imports")
     print(f"  ❌ {len(files_with_errors)} files have import errors")
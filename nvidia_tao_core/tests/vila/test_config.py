@@ -16,6 +16,7 @@
 
 import pytest
 import json
+from functools import lru_cache
 
 from omegaconf import OmegaConf
 
@@ -93,51 +94,42 @@ def generate_json_schema(dataclass_instance):
     return create_json_schema(json_with_meta_config)
 
 
-@pytest.fixture
-def _test_trainer_spec():
-    trainer_config = TrainConfig()
-    yield trainer_config
+@lru_cache(maxsize=None)
+def _structured(dataclass_class):
+    """Build the OmegaConf structured schema once per dataclass."""
+    return OmegaConf.structured(dataclass_class)
 
 
-@pytest.fixture
-def _test_system_spec():
-    system_config = SystemConfig()
-    yield system_config
-
-
-@pytest.fixture
-def _test_experiment_spec():
-    experiment_config = ExperimentConfig()
-    yield experiment_config
+@lru_cache(maxsize=None)
+def _json_schema(dataclass_class):
+    """Generate the json schema once per dataclass."""
+    return generate_json_schema(dataclass_class())
 
 
 @pytest.mark.vila
 @pytest.mark.vlm_unit
 @pytest.mark.config
-def test_trainer_jsonschema_config(_test_trainer_spec):
+def test_trainer_jsonschema_config():
     """Test jsonschema conversion for train spec."""
-    json_with_meta_config = dataclass_to_json(_test_trainer_spec)
-    json_schema = create_json_schema(json_with_meta_config)
+    json_schema = _json_schema(TrainConfig)
     assert json.dumps(json_schema, indent=4), "Failed to dump train schema to JSON"
 
 
 @pytest.mark.vila
 @pytest.mark.vlm_unit
 @pytest.mark.config
-def test_system_jsonschema_config(_test_system_spec):
+def test_system_jsonschema_config():
     """Test jsonschema conversion for augmentation spec."""
-    json_with_meta_config = dataclass_to_json(_test_system_spec)
-    json_schema = create_json_schema(json_with_meta_config)
+    json_schema = _json_schema(SystemConfig)
     assert json.dumps(json_schema, indent=4), "Failed to dump evaluate schema to JSON"
 
 
 @pytest.mark.vila
 @pytest.mark.vlm_unit
 @pytest.mark.config
-def test_experiment_jsonschema_conversion(_test_experiment_spec):
+def test_experiment_jsonschema_conversion():
     """Test jsonschema conversion for augmentation spec."""
-    json_with_meta_config = dataclass_to_json(_test_experiment_spec)
-    json_schema = create_json_schema(json_with_meta_config)
+    json_schema = _json_schema(ExperimentConfig)
     assert json.dumps(json_schema, indent=4), "Failed to dump inference schema to JSON"
 
 
@@ -160,9 +152,9 @@ def test_load_experiment_spec(
     dataclass_class_name,
 ):
     """Simple function to load and validate the structure config from a yaml file."""
-    schema = OmegaConf.structured(dataclass_class_name)
+    schema = _structured(dataclass_class_name)
     config = OmegaConf.create(yaml_string)
     assert OmegaConf.merge(schema, config), "Failed to merge schema with config"
-    json_schema = generate_json_schema(dataclass_class_name())
+    json_schema = _json_schema(dataclass_class_name)
     validation_status = validate_jsonschema(config, json_schema["properties"])
     assert not (validation_status), "Validation should have failed for invalid config"
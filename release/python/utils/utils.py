@@ -20,7 +20,6 @@ from __future__ import print_function
 
 import glob
 import os
-import setuptools
 
 # Rename all .py files to .py_tmp temporarily.
 ignore_list = ['__init__.py', '__version__.py']
@@ -96,7 +95,28 @@ def find_packages(package_name):
     Returns:
         packages (list): List of packages.
     """
-    packages = setuptools.find_packages(package_name)
-    packages = [f"{package_name}.{f}" for f in packages]
+    packages = [f"{package_name}.{f}" for f in _find_subpackages(package_name)]
     packages.append(package_name)
     return packages
+
+
+def _find_subpackages(path, prefix=""):
+    """Dotted names of the packages below path, like setuptools.find_packages.
+
+    Only directories with an __init__.py are descended into, and the type of
+    each entry comes from os.scandir, so there is no per-entry stat call.
+    """
+    packages = []
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return packages
+    for entry in entries:
+        if '.' in entry.name or not entry.is_dir():
+            continue
+        if not os.path.isfile(os.path.join(entry.path, '__init__.py')):
+            continue
+        package = prefix + entry.name
+        packages.append(package)
+        packages.extend(_find_subpackages(entry.path, package + "."))
+    return packages
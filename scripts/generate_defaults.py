@@ -10,7 +10,7 @@ REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONFIG_ROOT = os.path.join(REPO_ROOT, "nvidia_tao_core/config")
 
 SUPPORTED_MODULES = [
-    item for item in os.listdir(CONFIG_ROOT) if item not in ["utils"] and os.path.isdir(os.path.join(CONFIG_ROOT, item))
+    entry.name for entry in os.scandir(CONFIG_ROOT) if entry.name not in ["utils"] and entry.is_dir()
 ]
 
 
@@ -14,6 +14,7 @@
 
 """Setup script to build TAO-Core."""
 
+import glob
 import os
 import setuptools
 
@@ -26,7 +27,8 @@ PACKAGE_LIST = [
 def read_requirements():
     """Read dependencies from requirements-pip.txt."""
     with open("requirements.txt", encoding="utf-8") as f:
-        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        lines = f.read().splitlines()
+    return [line for line in map(str.strip, lines) if line and line[0] != "#"]
 
 
 version_locals = utils.get_version_details()
@@ -34,7 +36,23 @@ setuptools_packages = []
 for package_name in PACKAGE_LIST:
     setuptools_packages.extend(utils.find_packages(package_name))
 
-if os.path.exists("pyarmor_runtime_001219"):
+
+def package_files(package_dir, pattern):
+    """Files under package_dir matching pattern, relative to package_dir.
+
+    Expanded once here so setuptools gets a concrete list instead of globbing.
+    """
+    matches = glob.glob(os.path.join(package_dir, pattern), recursive=True)
+    return sorted(os.path.relpath(f, package_dir) for f in matches if os.path.isfile(f))
+
+
+MICROSERVICES_DIR = os.path.join("nvidia_tao_core", "microservices")
+
+# Entries of the project root from a single directory listing
+TOP_LEVEL_ENTRIES = {entry.name: entry for entry in os.scandir(".")}
+
+pyarmor_entry = TOP_LEVEL_ENTRIES.get("pyarmor_runtime_001219")
+if pyarmor_entry is not None and pyarmor_entry.is_dir():
     pyarmor_packages = ["pyarmor_runtime_001219"]
     setuptools_packages += pyarmor_packages
 
@@ -58,10 +76,10 @@ setuptools.setup(
         '': ['*.py', "*.pyc", "*.yaml", "*.so", "*.pdf"],
         'nvidia_tao_core.microservices': [
             'pretrained_models.csv',
-            'specs_utils/specs/**/*.csv',
+            *package_files(MICROSERVICES_DIR, 'specs_utils/specs/**/*.csv'),
             '*.sh',
             'uwsgi.ini',
-            'handlers/network_configs/*',
+            *package_files(MICROSERVICES_DIR, 'handlers/network_configs/*'),
             'nginx.conf',
             'templates/*'
         ]